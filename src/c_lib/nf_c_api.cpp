@@ -29,6 +29,14 @@ int calculate_character_count(const char* text, int include_spaces) {
     return calculate_character_count_c(text, include_spaces);
 }
 
+/**
+ * @brief C-API wrapper for calculate_text_stats_c.
+ */
+void calculate_text_stats(const char* text, int* word_count, int* char_count_no_spaces) {
+    // Direct call to the existing C++-backed C function
+    calculate_text_stats_c(text, word_count, char_count_no_spaces);
+}
+
 /**
  * @brief C-API wrapper for calculate_read_time_c.
  * NOTE: The Python caller is responsible for freeing the returned string (const char*).
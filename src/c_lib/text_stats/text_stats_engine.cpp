@@ -59,6 +59,38 @@ int calculate_character_count_c(const char* text, int include_spaces) {
     }
 }
 
+/**
+ * @brief Calculates the word count and non-whitespace character count together.
+ * * A single pass over the text combining calculate_word_count_c and 
+ * calculate_character_count_c (with include_spaces = 0).
+ */
+void calculate_text_stats_c(const char* text, int* word_count, int* char_count_no_spaces) {
+    int words = 0;
+    int chars = 0;
+    bool in_word = false;
+
+    if (text) {
+        for (const char* p = text; *p != '\0'; ++p) {
+            if (isspace(static_cast<unsigned char>(*p))) {
+                in_word = false;
+            } else {
+                chars++;
+                if (!in_word) {
+                    words++;
+                    in_word = true;
+                }
+            }
+        }
+    }
+
+    if (word_count) {
+        *word_count = words;
+    }
+    if (char_count_no_spaces) {
+        *char_count_no_spaces = chars;
+    }
+}
+
 /**
  * @brief Calculates the read time of a number of wrods.
  */
@@ -26,6 +26,16 @@ int calculate_word_count_c(const char* text);
  */
 int calculate_character_count_c(const char* text, int include_spaces);
 
+/**
+ * @brief Calculates the word count and the character count without whitespace
+ * of the text in a single pass.
+ *
+ * @param text The input string (expected to be UTF-8 encoded).
+ * @param word_count Output for the number of words.
+ * @param char_count_no_spaces Output for the number of non-whitespace characters/bytes.
+ */
+void calculate_text_stats_c(const char* text, int* word_count, int* char_count_no_spaces);
+
 /**
  * @brief Calculates the read time of the given text.
  *
@@ -0,0 +1,20 @@
+# src/python/__init__.py
+
+def __getattr__(name: str):
+    """
+    Lazily resolves heavy package attributes on first access (PEP 562).
+
+    Importing the package for its utilities or constants should not execute
+    the entire body of ``main_window.py`` and its GUI imports, so
+    ``MainWindow`` is only imported once something actually asks for it.
+
+    :param name: The name of the attribute being accessed.
+    :type name: str
+
+    :returns: The resolved attribute.
+    :raises AttributeError: If the attribute is not lazily provided by the package.
+    """
+    if name == "MainWindow":
+        from .main_window import MainWindow
+        return MainWindow
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,7 +2,7 @@
 
 import sqlite3
 import os
-from typing import Any
+from typing import Any, Iterator
 
 from .utils.resource_path import get_resource_path
 from .utils.exceptions import DatabaseError
@@ -10,6 +10,11 @@ from .utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Number of compiled statements sqlite3 keeps per connection (the default is 128). The
+# repositories run a fixed set of literal queries, so a larger cache lets all of them
+# skip re-parsing on hot paths such as autosave and outline selection.
+_CACHED_STATEMENTS = 256
+
 class DBConnector:
     """
     Handles the connection, initialization, and safe query execution for the 
@@ -51,15 +56,25 @@ class DBConnector:
         :rtype: bool
         """
         try:
-            self.conn = sqlite3.connect(self.db_path)
+            self.conn = sqlite3.connect(self.db_path, cached_statements=_CACHED_STATEMENTS)
             self.conn.row_factory = sqlite3.Row
+            # WAL lets outline reads run alongside autosave writes; it keeps '-wal' and '-shm'
+            # files next to the database and needs the project on a local (not network) drive.
+            # Under WAL, synchronous=NORMAL skips an fsync per commit: the database can't be
+            # corrupted by a crash, but a power loss may roll back the last few saves.
             self.conn.execute("PRAGMA journal_mode = WAL;")
-            self.conn.execute("PRAGMA synchronous=FULL;")
+            self.conn.execute("PRAGMA synchronous = NORMAL;")
+            self.conn.execute("PRAGMA temp_store = MEMORY;")
+            # Reads through the first 256 MB of the file use memory-mapped pages instead of
+            # read() calls. Anything past that falls back to normal I/O, so larger projects
+            # still work. Mapped pages are shared with the OS page cache rather than copied.
+            self.conn.execute("PRAGMA mmap_size = 268435456;") # 256 MB
+            self.conn.execute("PRAGMA cache_size = -20000;") # ~20 MB page cache (default is ~2 MB)
             self.conn.execute("PRAGMA foreign_keys = ON;")
-            logger.info(f"Successfully connected to database at: {self.db_path}")
+            logger.info("Successfully connected to database at: %s", self.db_path)
             return True
         except sqlite3.Error as e:
-            logger.error(f"Database connection error at {self.db_path}: {e}", exc_info=True)
+            logger.error("Database connection error at %s: %s", self.db_path, e, exc_info=True)
             self.conn = None
             raise DatabaseError(
                 message=f"Failed to connect to the database at '{self.db_path}'.",
@@ -74,12 +89,15 @@ class DBConnector:
         """
         if self.conn:
             try:
+                # Refresh the planner statistics for tables whose queries would benefit,
+                # so index choices keep up with the project's data
+                self.conn.execute("PRAGMA optimize;")
                 self.conn.close()
                 self.conn = None
                 logger.info("Database connection closed successfully.")
             except sqlite3.Error as e:
                 # While rare, guard for closing errors
-                logger.error(f"Error closing database connection: {e}", exc_info=True)
+                logger.error("Error closing database connection: %s", e, exc_info=True)
 
     def initialize_schema(self) -> None:
         """
@@ -97,28 +115,68 @@ class DBConnector:
         try:
             with open(self.schema_path, 'r', encoding='utf-8') as f:
                 schema_sql = f.read()
+
+            existing_tables = self._get_table_names()
                 
             self.conn.executescript(schema_sql)
+
+            # Full-text indexes added to an existing project start empty, so fill them
+            # once from their content tables; triggers keep them in sync afterwards.
+            for fts_table in self._get_table_names(fts_only=True) - existing_tables:
+                self.conn.execute(f"INSERT INTO {fts_table} ({fts_table}) VALUES ('rebuild');")
+
             self.conn.commit()
             logger.info("Database schema initialized successfully.")
             
         except sqlite3.Error as e:
             # Log and raise on SQL execution error
-            logger.error(f"SQL Error during schema initialization: {e}", exc_info=True)
+            logger.error("SQL Error during schema initialization: %s", e, exc_info=True)
             raise DatabaseError(
                 message="A SQL error occurred during schema initialization.",
                 original_exception=e
             ) from e
         except FileNotFoundError as e:
             # Log and raise on missing schema file
-            logger.error(f"Schema file not found at {self.schema_path}", exc_info=True)
+            logger.error("Schema file not found at %s", self.schema_path, exc_info=True)
             raise DatabaseError(
                 message=f"Schema file not found at '{self.schema_path}'.",
                 original_exception=e
             ) from e
 
+    def _get_table_names(self, fts_only: bool = False) -> set[str]:
+        """
+        Retrieves the names of the tables currently in the database.
+
+        :param fts_only: If True, only returns FTS5 virtual tables. Default is False.
+        :type fts_only: bool
+        :returns: The set of table names.
+        :rtype: set[str]
+        """
+        query = "SELECT name FROM sqlite_master WHERE type = 'table'"
+        if fts_only:
+            query += " AND sql LIKE 'CREATE VIRTUAL TABLE%USING fts5%'"
+        return {row[0] for row in self.conn.execute(query)}
+
     # --- Core Execution Methods (Used by all Repositories) ---
 
+    def _cursor(self, as_list: bool = False) -> sqlite3.Cursor:
+        """
+        Creates a cursor on the active connection.
+
+        When rows are wanted as plain tuples the cursor's row factory is removed, 
+        so SQLite's tuples are returned directly instead of building a 
+        :py:obj:`sqlite3.Row` for every row and copying it.
+
+        :param as_list: If True, the cursor returns rows as tuples.
+        :type as_list: bool
+        :returns: The new cursor.
+        :rtype: :py:class:`sqlite3.Cursor`
+        """
+        cursor = self.conn.cursor()
+        if as_list:
+            cursor.row_factory = None
+        return cursor
+
     def _execute_query(self, sql: str, params: tuple | None = None, fetch_one: bool = False, 
                        fetch_all: bool = False, as_list: bool = False) -> Any:
         """
@@ -146,22 +204,59 @@ class DBConnector:
             raise DatabaseError("DB not connected for query execution.")
 
         try:
-            cursor = self.conn.execute(sql, params or ())
+            cursor = self._cursor(as_list).execute(sql, params or ())
             
             if fetch_one:
                 row = cursor.fetchone()
-                return dict(row) if row and not as_list else (tuple(row) if row and as_list else None)
+                return dict(row) if row and not as_list else (row if row and as_list else None)
             
             if fetch_all:
                 rows = cursor.fetchall()
                 if as_list:
-                    return [tuple(row) for row in rows]
+                    return rows
                 return [dict(row) for row in rows]
             
             return None # Should not happen for SELECT queries, but handles non-select
         except sqlite3.Error as e:
             # Log and raise on SQL query error
-            logger.error(f"Database Query Error: {e}\nSQL: {sql}\nParams: {params}", exc_info=True)
+            logger.error("Database Query Error: %s\nSQL: %s\nParams: %s", e, sql, params, exc_info=True)
+            raise DatabaseError(
+                message=f"Error executing query: {sql}.",
+                original_exception=e
+            ) from e
+
+    def _execute_query_iter(self, sql: str, params: tuple | None = None, 
+                            as_list: bool = False) -> Iterator[dict | tuple]:
+        """
+        Internal generator for streaming the rows of large SELECT queries.
+
+        Rows are read from the live cursor one at a time instead of being 
+        materialized with ``fetchall``, so peak memory stays at a single row 
+        (e.g. one chapter's full text) rather than the whole result set.
+
+        :param sql: The SQL query string to execute.
+        :type sql: str
+        :param params: A tuple of parameters to safely bind to the query. Defaults to None.
+        :type params: tuple or None
+        :param as_list: If True, yields each row as a tuple instead of a dictionary.
+        :type as_list: bool
+        :returns: An iterator over the query's rows.
+        :rtype: Iterator[dict or tuple]
+        """
+        if not self.conn:
+            # Raise an error if connection is missing
+            raise DatabaseError("DB not connected for query execution.")
+
+        try:
+            cursor = self._cursor(as_list).execute(sql, params or ())
+            if as_list:
+                yield from cursor
+            else:
+                for row in cursor:
+                    yield dict(row)
+        except sqlite3.Error as e:
+            # Log and raise on SQL query error
+            logger.error("Database Query Error: %s\nSQL: %s\nParams: %s", e, sql, params, exc_info=True)
             raise DatabaseError(
                 message=f"Error executing query: {sql}.",
                 original_exception=e
@@ -197,7 +292,7 @@ class DBConnector:
             return True
         except sqlite3.Error as e:
             # Log, rollback, and raise on SQL commit error
-            logger.error(f"Database Commit Error: {e}\nSQL: {sql}\nParams: {params}", exc_info=True)
+            logger.error("Database Commit Error: %s\nSQL: %s\nParams: %s", e, sql, params, exc_info=True)
             self.conn.rollback()
             raise DatabaseError(
                 message=f"Error executing database modification (INSERT/UPDATE/DELETE). Transaction \
@@ -229,7 +324,57 @@ class DBConnector:
         
         except sqlite3.Error as e:
             # Log, rollback, and raise on transaction error
-            logger.error(f"Database Transaction Error: {e}\nOperations: {operations}", exc_info=True)
+            logger.error("Database Transaction Error: %s\nOperations: %s", e, operations, exc_info=True)
+            self.conn.rollback()
+            raise DatabaseError(
+                message="Error executing database transaction. All operations rolled back.",
+                original_exception=e
+            ) from e
+
+    def _execute_many(self, sql: str, params_seq: list[tuple], 
+                      fetch_ids: bool = False) -> bool | list[int]:
+        """
+        Executes one non-SELECT statement for every parameter tuple in a single, 
+        atomic transaction.
+
+        The statement is prepared once and the bind/step loop runs inside 
+        :py:meth:`sqlite3.Connection.executemany`. If any row fails, the entire 
+        transaction is rolled back.
+
+        :param sql: The SQL query string to execute for each parameter tuple.
+        :type sql: str
+        :param params_seq: A list of parameter tuples, one per execution.
+        :type params_seq: list[tuple]
+        :param fetch_ids: If True, each row is executed on its own to read its 
+            :py:attr:`~sqlite3.Cursor.lastrowid`, since executemany only reports the last one. 
+            The statement is still prepared once through the statement cache. Default is False.
+        :type fetch_ids: bool
+        :returns: True if all executions succeed and the transaction commits, or the 
+            inserted row IDs in order if fetch_ids=True.
+        :rtype: bool or list[int]
+        """
+        if not self.conn:
+            # Raise an error if connection is missing
+            raise DatabaseError("DB not connected for transaction.")
+
+        try:
+            if fetch_ids:
+                cursor = self.conn.cursor()
+                row_ids = []
+                for params in params_seq:
+                    cursor.execute(sql, params)
+                    row_ids.append(cursor.lastrowid)
+                self.conn.commit()
+                return row_ids
+
+            self.conn.executemany(sql, params_seq)
+            self.conn.commit()
+            return True
+
+        except sqlite3.Error as e:
+            # Log, rollback, and raise on transaction error
+            logger.error("Database Transaction Error: %s\nSQL: %s\nParams: %s",
+                         e, sql, params_seq, exc_info=True)
             self.conn.rollback()
             raise DatabaseError(
                 message="Error executing database transaction. All operations rolled back.",
@@ -99,6 +99,8 @@ class ApplicationFlowManager:
         self.start_menu.close() if self.start_menu else None
         self.start_menu = None
 
+        # Reload first, the closed window may have saved settings since they were read
+        self.settings = self.settings_manager.load_settings()
         self.settings ['last_project_path'] = project_path
         self.settings_manager.save_settings(self.settings)
         
@@ -1,7 +1,7 @@
 # src/python/main_window.py
 
 from PySide6.QtWidgets import (
-QMainWindow, QSplitter, QMessageBox, QDialog, QFrame, QVBoxLayout, QPushButton, QLineEdit, QWidget, QHBoxLayout
+QMainWindow, QSplitter, QDialog, QFrame, QVBoxLayout, QPushButton, QLineEdit, QWidget, QHBoxLayout
 )
 from PySide6.QtCore import Qt, QTimer, QTimer, QThread, Signal
 from PySide6.QtGui import QCloseEvent, QResizeEvent, QIcon
@@ -248,7 +248,8 @@ class MainWindow(QMainWindow):
         
         self.outline_stack, self.editor_stack = UIFactory.create_components(
             project_title=self.project_title,
-            settings=self.current_settings
+            settings=self.current_settings,
+            settings_manager=self.settings_manager
         )
 
         # Main Splitter
@@ -437,6 +438,7 @@ class MainWindow(QMainWindow):
         except Exception as e:
             # Catch unexpected errors during dialog creation or settings processing
             logger.critical("FATAL ERROR: Failed to process SettingsDialog results.", exc_info=True)
+            from PySide6.QtWidgets import QMessageBox
             QMessageBox.critical(
                 self, 
                 "Settings Error", 
@@ -1,7 +1,10 @@
 # src/python/chapter_repository.py
 
+import json
+from typing import Iterator
+
 from ..utils.types import ChapterContentDict, ChapterBasicDict
-from ..utils.text_stats import calculate_word_count, calculate_character_count
+from ..utils.text_stats import calculate_text_stats
 from ..utils.logger import get_logger
 from ..utils.exceptions import DatabaseError
 from ..db_connector import DBConnector
@@ -26,6 +29,16 @@ class ChapterRepository:
         :rtype: None
         """
         self.db = db_connector
+
+        # Bind the connector's execution methods once so hot lookups skip an attribute hop
+        self._execute_query = db_connector._execute_query
+        self._execute_query_iter = db_connector._execute_query_iter
+        self._execute_commit = db_connector._execute_commit
+        self._execute_many = db_connector._execute_many
+
+        # Chapter titles by ID, kept in sync by the methods that change or delete a title
+        self._title_cache: dict[int, str] = {}
+
         logger.debug("ChapterRepository initialized.")
 
     def get_all_chapters(self) -> ChapterBasicDict:
@@ -45,8 +58,8 @@ class ChapterRepository:
         ORDER BY Sort_Order ASC;
         """
         try:
-            results = self.db._execute_query(query, fetch_all=True)
-            logger.info(f"Retrieved {len(results)} basic chapter records.")
+            results = self._execute_query(query, fetch_all=True)
+            logger.info("Retrieved %s basic chapter records.", len(results))
             return results
         except DatabaseError as e:
             logger.error("Failed to retrieve all basic chapters.", exc_info=True)
@@ -66,11 +79,36 @@ class ChapterRepository:
         """
         query = "SELECT Title, Text_Content FROM Chapters WHERE ID = ?;"
         try:
-            result = self.db._execute_query(query, (chapter_id,), fetch_one=True)
-            logger.debug(f"Retrieved content for chapter ID: {chapter_id}.")
+            result = self._execute_query(query, (chapter_id,), fetch_one=True)
+            logger.debug("Retrieved content for chapter ID: %s.", chapter_id)
             return result
         except DatabaseError as e:
-            logger.error(f"Failed to retrieve content for chapter ID: {chapter_id}.", exc_info=True)
+            logger.error("Failed to retrieve content for chapter ID: %s.", chapter_id, exc_info=True)
+            raise e
+        
+    def get_chapters_bulk(self, chapter_ids: list[int]) -> dict[int, str]:
+        """
+        Retrieves the rich text content of several chapters in a single query.
+
+        Used instead of calling :py:meth:`.get_chapter_details` once per chapter 
+        when several chapters are needed at once.
+
+        :param chapter_ids: The IDs of the chapters to get text content from.
+        :type chapter_ids: list[int]
+
+        :returns: A dictionary mapping each found chapter ID to its text content.
+        :rtype: dict[int, str]
+        """
+        if not chapter_ids:
+            return {}
+
+        query = "SELECT ID, Text_Content FROM Chapters WHERE ID IN (SELECT value FROM json_each(?));"
+        try:
+            results = self._execute_query(query, (json.dumps(list(chapter_ids)),), fetch_all=True)
+            logger.debug("Retrieved content for %s of %s requested chapters.", len(results), len(chapter_ids))
+            return {row['ID']: row['Text_Content'] for row in results}
+        except DatabaseError as e:
+            logger.error("Failed to retrieve content for chapter IDs: %s.", chapter_ids, exc_info=True)
             raise e
         
     def get_chapter_title(self, chapter_id: int) -> str | None:
@@ -85,14 +123,38 @@ class ChapterRepository:
         :returns: The chapter title if found, otherwise None
         :rtype: str or None
         """
+        if chapter_id in self._title_cache:
+            return self._title_cache[chapter_id]
+
         query = "SELECT Title FROM Chapters WHERE ID = ?;"
         try:
-            result = self.db._execute_query(query, (chapter_id,), fetch_one=True)
+            result = self._execute_query(query, (chapter_id,), fetch_one=True)
             title = result['Title'] if result else None
-            logger.debug(f"Retrieved title for chapter ID: {chapter_id}. Title: {title}")
+            if title is not None:
+                self._title_cache[chapter_id] = title
+            logger.debug("Retrieved title for chapter ID: %s. Title: %s", chapter_id, title)
             return title
         except DatabaseError as e:
-            logger.error(f"Failed to retrieve title for chapter ID: {chapter_id}.", exc_info=True)
+            logger.error("Failed to retrieve title for chapter ID: %s.", chapter_id, exc_info=True)
+            raise e
+        
+    def chapter_exists(self, chapter_id: int) -> bool:
+        """
+        Checks whether a chapter with the given ID exists, without reading any 
+        of its columns.
+
+        :param chapter_id: The ID of the chapter to check.
+        :type chapter_id: int
+
+        :returns: True if the chapter exists, otherwise False.
+        :rtype: bool
+        """
+        query = "SELECT 1 FROM Chapters WHERE ID = ? LIMIT 1;"
+        try:
+            result = self._execute_query(query, (chapter_id,), fetch_one=True, as_list=True)
+            return result is not None
+        except DatabaseError as e:
+            logger.error("Failed to check existence of chapter ID: %s.", chapter_id, exc_info=True)
             raise e
         
     def get_all_chapters_for_export(self, chapter_ids: list[int] = None) -> list[dict]:
@@ -107,46 +169,94 @@ class ChapterRepository:
         :returns: A list containing all Chapter dicts.
         :rtype: list[dict]
         """
-        query = """
-        SELECT ID, Title, Text_Content, Sort_Order
-        FROM Chapters
+        results = list(self.iter_chapters_for_export(chapter_ids))
+        if chapter_ids:
+            logger.info("Retrieved %s chapters for export from a list of %s IDs.", 
+                        len(results), len(chapter_ids))
+        else:
+            logger.info("Retrieved all %s chapters for export.", len(results))
+        return results
+
+    def get_all_chapters_for_export_with_pov(self, chapter_ids: list[int] = None) -> list[dict]:
         """
+        Retrieves chapter details (ID, Title, Content, Sort_Order) along with the 
+        name of each chapter's POV character (POV_Name) for export purposes, 
+        optionally filtered by a list of IDs.
+
+        The POV names are joined in the same query rather than looked up 
+        per chapter.
+
+        :param chapter_ids: A list of all the chapters ID that wish to be exported. Default
+            is None which results in all chapters.
+        :type chapter_ids: list[int]
+
+        :returns: A list containing all Chapter dicts, POV_Name is None for chapters
+            without a POV character.
+        :rtype: list[dict]
+        """
+        results = list(self.iter_chapters_for_export(chapter_ids, include_pov=True))
+        logger.info("Retrieved %s chapters with POV characters for export.", len(results))
+        return results
+
+    def iter_chapters_for_export(self, chapter_ids: list[int] = None, 
+                                 include_pov: bool = False) -> Iterator[dict]:
+        """
+        Streams chapter details (ID, Title, Content, Sort_Order) for export purposes,
+        optionally filtered by a list of IDs.
+
+        Chapters are yielded one at a time from the database cursor, so only a 
+        single chapter's content is held in memory at once.
+
+        :param chapter_ids: A list of all the chapters ID that wish to be exported. Default
+            is None which results in all chapters.
+        :type chapter_ids: list[int]
+        :param include_pov: If True, each chapter also includes its POV character's name
+            as POV_Name. Default is False.
+        :type include_pov: bool
+
+        :returns: An iterator over the Chapter dicts, ordered by Sort_Order.
+        :rtype: Iterator[dict]
+        """
+        if include_pov:
+            query = """
+            SELECT C.ID, C.Title, C.Text_Content, C.Sort_Order, P.Name AS POV_Name
+            FROM Chapters AS C
+            LEFT JOIN Characters AS P ON C.POV_Character_ID = P.ID
+            """
+        else:
+            query = """
+            SELECT C.ID, C.Title, C.Text_Content, C.Sort_Order
+            FROM Chapters AS C
+            """
         params = ()
 
         # Modify the query if specific IDs are requested
         if chapter_ids is not None and chapter_ids:
-            # Ensure IDs are unique and sorted for consistent query execution
-            unique_ids = sorted(list(set(chapter_ids)))
-
-            # Create placeholders for the IN clause (e.g., ?, ?, ?)
-            placeholders = ', '.join(['?'] * len(unique_ids))
-
-            query += f" WHERE ID IN ({placeholders})"
-            params = tuple(unique_ids)
+            # Bind the IDs, de-duplicated and sorted in one pass, as a single JSON array so the
+            # statement stays the same size (and under SQLite's host-parameter limit) however
+            # many chapters are requested.
+            query += " WHERE C.ID IN (SELECT value FROM json_each(?))"
+            params = (json.dumps(sorted({*chapter_ids})),)
 
         # Add final ordering clause
-        query += " ORDER BY Sort_Order ASC;"
+        query += " ORDER BY C.Sort_Order ASC;"
 
-        # Execute the query using the DBConnector helper method
+        # Stream the rows using the DBConnector helper method
         try:
-            results = self.db._execute_query(query, params, fetch_all=True)
-            if chapter_ids:
-                logger.info(f"Retrieved {len(results)} chapters for export from a list of " 
-                            "{len(chapter_ids)} IDs.")
-            else:
-                logger.info(f"Retrieved all {len(results)} chapters for export.")
-            return results if results else []
+            yield from self._execute_query_iter(query, params)
         except DatabaseError as e:
             logger.error("Failed to retrieve chapters for export.", exc_info=True)
             raise e
         
-    def _get_all_chapters_with_content(self) -> dict:
+    def _get_all_chapters_with_content(self) -> Iterator[tuple]:
         """
-        Retrieves all chapters with their full text content, ordered by Sort_Order.
+        Streams all chapters with their full text content, ordered by Sort_Order.
 
-        An Internal helper method for get_all_chapters_stats.
+        An Internal helper method for get_all_chapters_stats. Chapters are yielded one at a time as plain 
+        ``(ID, Title, Text_Content, Sort_Order)`` tuples, so only a single chapter's 
+        content is held in memory at once and no dict is built per row.
 
-        :rtype: dict
+        :rtype: Iterator[tuple]
         """
         query = """
         SELECT ID, Title, Text_Content, Sort_Order
@@ -154,43 +264,37 @@ class ChapterRepository:
         ORDER BY Sort_Order ASC;
         """
         try:
-            results = self.db._execute_query(query, fetch_all=True)
-            logger.info(f"Retrieved {len(results)} chapters with full content.")
-            return results
+            yield from self._execute_query_iter(query, as_list=True)
         except DatabaseError as e:
             logger.error("Failed to retrieve all chapters with content.", exc_info=True)
             raise e
         
     def get_all_chapters_stats(self, wpm: int = 250) -> list[dict]:
         """
-        Retrieves all chapters with their full text content, calculates
-        word count, character count, and estimated read time for each.
+        Calculates the word count and character count of every chapter, 
+        ordered by Sort_Order.
+
+        Chapters are streamed from the database one at a time and each one's 
+        text is scanned once by the native text statistics library, so only 
+        the small stats dict is kept per chapter.
 
         :param wpm: Words per minute for read time calculation. Default is 250.
         :type wpm: int
         
-        :returns: A list of dictionaries, each containing chapter basic info
-                  and the calculated statistics.
+        :returns: A list of dictionaries, each containing the chapter's 
+                  calculated statistics.
         :rtype: list[dict]
         """
-        all_chapters = self._get_all_chapters_with_content() # Efficiently gets all rows
-
         chapters_with_stats = []
-        for chapter in all_chapters:
-            text_content = chapter['Text_Content'] or "" # Handle potential None content
-            
-            # 1. Calculate Statistics
-            word_count = calculate_word_count(text_content)
-            char_count = calculate_character_count(text_content, include_spaces=False)
-
-            # 2. Compile the results
-            stats_dict = {
+        for _, _, text_content, _ in self._get_all_chapters_with_content():
+            word_count, char_count = calculate_text_stats(text_content or "") # Handle potential None content
+
+            chapters_with_stats.append({
                 'word_count': word_count,
                 'char_count_no_spaces': char_count,
-            }
-            chapters_with_stats.append(stats_dict)
+            })
 
-        logger.info(f"Calculated statistics for {len(chapters_with_stats)} chapters.")
+        logger.info("Calculated statistics for %s chapters.", len(chapters_with_stats))
         return chapters_with_stats
 
     def create_chapter(self, title: str, sort_order, text_content: str = "<p></p>", 
@@ -215,14 +319,14 @@ class ChapterRepository:
         VALUES (?, ?, ?, ?);
         """
         try:
-            chapter_id = self.db._execute_commit(
+            chapter_id = self._execute_commit(
                 query, (title, text_content, sort_order, pov_character_id), fetch_id=True
             )
             if chapter_id:
-                logger.info(f"Created new chapter: ID={chapter_id}, Title='{title}', SortOrder={sort_order}.")
+                logger.info("Created new chapter: ID=%s, Title='%s', SortOrder=%s.", chapter_id, title, sort_order)
             return chapter_id
         except DatabaseError as e:
-            logger.error(f"Failed to create new chapter with title: '{title}'.", exc_info=True)
+            logger.error("Failed to create new chapter with title: '%s'.", title, exc_info=True)
             raise e
     
     def update_chapter_content(self, chapter_id: int, title: str, content: str) -> bool:
@@ -239,14 +343,20 @@ class ChapterRepository:
         :returns: True if successfully set update content otherwise False
         :rtype: bool
         """
-        query = "UPDATE Chapters SET Title = ?, Text_Content = ? WHERE ID = ?;"
+        # Saves that don't change anything (e.g. on every chapter switch) match no row,
+        # so SQLite has no page to rewrite and the commit writes nothing to the journal.
+        query = """
+        UPDATE Chapters SET Title = ?, Text_Content = ? 
+        WHERE ID = ? AND (Title IS NOT ? OR Text_Content IS NOT ?);
+        """
         try:
-            success = self.db._execute_commit(query, (title, content, chapter_id))
+            success = self._execute_commit(query, (title, content, chapter_id, title, content))
+            self._title_cache.pop(chapter_id, None)
             if success:
-                logger.info(f"Content updated for chapter ID: {chapter_id}.")
+                logger.info("Content updated for chapter ID: %s.", chapter_id)
             return success
         except DatabaseError as e:
-            logger.error(f"Failed to update content for chapter ID: {chapter_id}.", exc_info=True)
+            logger.error("Failed to update content for chapter ID: %s.", chapter_id, exc_info=True)
             raise e
     
     def delete_chapter(self, chapter_id: int) -> bool:
@@ -261,12 +371,13 @@ class ChapterRepository:
         """
         query = "DELETE FROM Chapters WHERE ID = ?;"
         try:
-            success = self.db._execute_commit(query, (chapter_id,))
+            success = self._execute_commit(query, (chapter_id,))
+            self._title_cache.pop(chapter_id, None)
             if success:
-                logger.warning(f"Chapter deleted: ID={chapter_id}.")
+                logger.warning("Chapter deleted: ID=%s.", chapter_id)
             return success
         except DatabaseError as e:
-            logger.error(f"Failed to delete chapter ID: {chapter_id}.", exc_info=True)
+            logger.error("Failed to delete chapter ID: %s.", chapter_id, exc_info=True)
             raise e
         
     def search_chapters(self, user_query: str) -> None:
@@ -295,11 +406,11 @@ class ChapterRepository:
         """
         params = (like_pattern, like_pattern)
         try:
-            results = self.db._execute_query(query, params, fetch_all=True)
-            logger.info(f"Chapter search for '{clean_query}' returned {len(results)} results.")
+            results = self._execute_query(query, params, fetch_all=True)
+            logger.info("Chapter search for '%s' returned %s results.", clean_query, len(results))
             return results
         except DatabaseError as e:
-            logger.error(f"Failed to execute search for chapters with query: '{clean_query}'.", exc_info=True)
+            logger.error("Failed to execute search for chapters with query: '%s'.", clean_query, exc_info=True)
             raise e
 
     def update_chapter_title(self, chapter_id: int, title: str) -> bool:
@@ -318,12 +429,13 @@ class ChapterRepository:
         """
         query = "UPDATE Chapters SET Title = ? WHERE ID = ?;"
         try:
-            success = self.db._execute_commit(query, (title, chapter_id))
+            success = self._execute_commit(query, (title, chapter_id))
+            self._title_cache.pop(chapter_id, None)
             if success:
-                logger.info(f"Title updated for chapter ID: {chapter_id}. New title: '{title}'.")
+                logger.info("Title updated for chapter ID: %s. New title: '%s'.", chapter_id, title)
             return success
         except DatabaseError as e:
-            logger.error(f"Failed to update title for chapter ID: {chapter_id}.", exc_info=True)
+            logger.error("Failed to update title for chapter ID: %s.", chapter_id, exc_info=True)
             raise e
     
     def reorder_chapters(self, chapter_updates: list[tuple[int, int]]) -> bool:
@@ -337,20 +449,16 @@ class ChapterRepository:
         :returns: True if all updates succeed and the transaction commits, False otherwise.
         :rtype: bool
         """
+        # One prepared statement is executed for every (new_sort_order, chapter_id) pair
         query = "UPDATE Chapters SET Sort_Order = ? WHERE ID = ?;"
-        
-        # Each operation is a tuple: (sql_query_string, parameters_tuple)
-        operations = []
-        for chapter_id, new_sort_order in chapter_updates:
-            # parameters are (new_sort_order, chapter_id) to match the SQL template
-            operations.append((query, (new_sort_order, chapter_id)))
+        params_seq = [(sort_order, chapter_id) for chapter_id, sort_order in chapter_updates]
 
-        # Execute all operations in a single transaction
+        # Execute all updates in a single transaction
         try:
-            success = self.db._execute_transaction(operations)
+            success = self._execute_many(query, params_seq)
             if success:
-                logger.info(f"Successfully reordered {len(operations)} chapters.")
+                logger.info("Successfully reordered %s chapters.", len(chapter_updates))
             return success
         except DatabaseError as e:
-            logger.error(f"Failed to reorder chapters. Attempted updates: {chapter_updates}.", exc_info=True)
+            logger.error("Failed to reorder chapters. Attempted updates: %s.", chapter_updates, exc_info=True)
             raise e
\ No newline at end of file
@@ -1,5 +1,9 @@
 # src/python/repository/character_repository
 
+import json
+from collections import OrderedDict
+from typing import Iterator
+
 from ..utils.types import DBRowList, CharacterDetailsDict, CharacterBasicDict
 from ..db_connector import DBConnector
 from ..utils.logger import get_logger
@@ -7,6 +11,16 @@ from ..utils.exceptions import DatabaseError
 
 logger = get_logger(__name__)
 
+# Most characters whose details are kept in memory. Details include the free-text fields,
+# so the least recently used characters are dropped past this size.
+_DETAILS_CACHE_SIZE = 512
+
+# Columns a character export may select, in their default order
+_EXPORT_COLUMNS = (
+    'ID', 'Name', 'Description', 'Status', 'Age', 'Date_Of_Birth',
+    'Occupation_School', 'Physical_Description'
+)
+
 class CharacterRepository:
     """
     Manages all database operations for the Character entity.
@@ -25,6 +39,18 @@ class CharacterRepository:
         :rtype: None
         """
         self.db = db_connector
+
+        # Bind the connector's execution methods once so hot lookups skip an attribute hop
+        self._execute_query = db_connector._execute_query
+        self._execute_query_iter = db_connector._execute_query_iter
+        self._execute_commit = db_connector._execute_commit
+        self._execute_many = db_connector._execute_many
+
+        # Character names and details by ID, kept in sync by the methods that change or delete them.
+        # Details are held in least-recently-used order.
+        self._name_cache: dict[int, str] = {}
+        self._details_cache: OrderedDict[int, CharacterDetailsDict] = OrderedDict()
+
         logger.debug("CharacterRepository initialized.")
 
     def get_all_characters(self) -> DBRowList | None:
@@ -40,8 +66,8 @@ class CharacterRepository:
         """
         query = "SELECT ID, Name FROM Characters ORDER BY Name ASC;"
         try:
-            results = self.db._execute_query(query, fetch_all=True)
-            logger.info(f"Retrieved {len(results)} basic character records.")
+            results = self._execute_query(query, fetch_all=True)
+            logger.info("Retrieved %s basic character records.", len(results))
             return results
         except DatabaseError as e:
             logger.error("Failed to retrieve all characters.", exc_info=True)
@@ -54,13 +80,11 @@ class CharacterRepository:
         :returns: A list each index containing the character's Name.
         :rtype: list[str]
         """
-        query = "SELECT NAME FROM Characters;"
+        query = "SELECT Name FROM Characters;"
         try:
-            char_dict = self.db._execute_query(query, fetch_all=True)
-            results = []
-            for char in char_dict:
-                results.append(char['Name'])
-            logger.info(f"Retrieved {len(results)} of all character names.")
+            rows = self._execute_query(query, fetch_all=True, as_list=True)
+            results = [name for (name,) in rows]
+            logger.info("Retrieved %s of all character names.", len(results))
             return results
         except DatabaseError as e:
             logger.error("Failed to retrieve all character names.", exc_info=True)
@@ -84,12 +108,21 @@ class CharacterRepository:
         FROM Characters
         WHERE ID = ?;
         """
+        if char_id in self._details_cache:
+            self._details_cache.move_to_end(char_id)
+            # Hand out a copy so callers editing the dict cannot change the cached row
+            return dict(self._details_cache[char_id])
+
         try:
-            details = self.db._execute_query(query, (char_id,), fetch_one=True)
-            logger.debug(f"Retrieved details for character ID: {char_id}. Found: {details is not None}")
+            details = self._execute_query(query, (char_id,), fetch_one=True)
+            if details is not None:
+                self._details_cache[char_id] = dict(details)
+                if len(self._details_cache) > _DETAILS_CACHE_SIZE:
+                    self._details_cache.popitem(last=False)
+            logger.debug("Retrieved details for character ID: %s. Found: %s", char_id, details is not None)
             return details
         except DatabaseError as e:
-            logger.error(f"Failed to retrieve details for character ID: {char_id}.", exc_info=True)
+            logger.error("Failed to retrieve details for character ID: %s.", char_id, exc_info=True)
             raise e
     
     def get_character_name(self, char_id) -> str | None:
@@ -102,14 +135,19 @@ class CharacterRepository:
         :returns: The character title if found, otherwise False
         :rtype: str or None
         """
+        if char_id in self._name_cache:
+            return self._name_cache[char_id]
+
         query = "SELECT Name FROM Characters WHERE ID = ?"
         try:
-            result = self.db._execute_query(query, (char_id,), fetch_one=True)
+            result = self._execute_query(query, (char_id,), fetch_one=True)
             name = result['Name'] if result else None
-            logger.debug(f"Retrieved name for character ID: {char_id}. Name: {name}")
+            if name is not None:
+                self._name_cache[char_id] = name
+            logger.debug("Retrieved name for character ID: %s. Name: %s", char_id, name)
             return name
         except DatabaseError as e:
-            logger.error(f"Failed to retrieve name for character ID: {char_id}.", exc_info=True)
+            logger.error("Failed to retrieve name for character ID: %s.", char_id, exc_info=True)
             raise e
     
     def get_content_by_name(self, name: str) -> list[dict] | None:
@@ -125,11 +163,11 @@ class CharacterRepository:
         search_term = f"%{name.strip()}%"
         query = "SELECT ID, Name, Description FROM Characters WHERE Name Like ? COLLATE NOCASE;"
         try:
-            result = self.db._execute_query(query, (search_term,), fetch_all=True)
-            logger.debug(f"Retrieved content by name search: '{name}'. Found: {result is not None}")
+            result = self._execute_query(query, (search_term,), fetch_all=True)
+            logger.debug("Retrieved content by name search: '%s'. Found: %s", name, result is not None)
             return result
         except DatabaseError as e:
-            logger.error(f"Failed to retrieve content for character name: '{name}'.", exc_info=True)
+            logger.error("Failed to retrieve content for character name: '%s'.", name, exc_info=True)
             raise e
         
     def get_number_of_characters(self) -> int:
@@ -141,18 +179,14 @@ class CharacterRepository:
         :returns: The number of characters.
         :rtype: int
         """
+        # COUNT(*) is answered from the narrow idx_characters_name index rather than the table
         query = "SELECT COUNT(*) FROM Characters;"
         try:
-            result = self.db._execute_query(query, fetch_all=True)
-            try:
-                count = result[0]['COUNT(*)']
-            except:
-                count = 0
-
-            return count
+            result = self._execute_query(query, fetch_one=True, as_list=True)
+            return result[0] if result else 0
         
         except DatabaseError as e:
-            logger.error("Failed to count all chapters.", exc_info=True)
+            logger.error("Failed to count all characters.", exc_info=True)
             raise e
     
     def create_character(self, name: str, description: str = "", status: str = "",
@@ -183,15 +217,40 @@ class CharacterRepository:
             VALUES (?, ?, ?, ?, ?, ?, ?);
             """
         try:
-            char_id = self.db._execute_commit(query, (name, description, status, age, date_of_birth, 
+            char_id = self._execute_commit(query, (name, description, status, age, date_of_birth, 
                                             occupation_school, physical_description), fetch_id=True)
             if char_id:
-                logger.info(f"Created new character: ID={char_id}, Name='{name}'.")
+                logger.info("Created new character: ID=%s, Name='%s'.", char_id, name)
             return char_id
         except DatabaseError as e:
-            logger.error(f"Failed to create new character with name: '{name}'.", exc_info=True)
+            logger.error("Failed to create new character with name: '%s'.", name, exc_info=True)
             raise e
     
+    def create_characters_bulk(self, characters: list[tuple[str, str, str]]) -> list[int]:
+        """
+        Inserts many new character records in a single, atomic transaction.
+
+        The remaining fields are set to the same defaults as :py:meth:`.create_character`.
+
+        :param characters: A list of tuples, where each tuple is (name, description, status).
+        :type characters: list[tuple[str, str, str]]
+
+        :returns: The IDs of the new characters in the order given.
+        :rtype: list[int]
+        """
+        query = """INSERT INTO Characters 
+            (Name, Description, Status, Age, Date_of_Birth, Occupation_School, Physical_Description) 
+            VALUES (?, ?, ?, -1, '', '', '');
+            """
+        try:
+            char_ids = self._execute_many(query, characters, fetch_ids=True)
+            logger.info("Created %s new characters.", len(char_ids))
+            return char_ids
+        except DatabaseError as e:
+            logger.error("Failed to create %s new characters. No characters were created.",
+                         len(characters), exc_info=True)
+            raise e
+
     def update_character(self, char_id: int, name: str, description: str = "", status: str = "",
                      age: int = -1, date_of_birth: str = "", occupation_school: str = "", 
                      physical_description: str = "") -> bool:
@@ -225,13 +284,15 @@ class CharacterRepository:
         WHERE ID = ?;
         """
         try:
-            success = self.db._execute_commit(query, (name, description, status, age, date_of_birth, 
+            success = self._execute_commit(query, (name, description, status, age, date_of_birth, 
                                                 occupation_school, physical_description, char_id))
+            self._name_cache.pop(char_id, None)
+            self._details_cache.pop(char_id, None)
             if success:
-                logger.info(f"Updated character ID: {char_id}. New Name: '{name}'.")
+                logger.info("Updated character ID: %s. New Name: '%s'.", char_id, name)
             return success
         except DatabaseError as e:
-            logger.error(f"Failed to update character ID: {char_id} with name '{name}'.", exc_info=True)
+            logger.error("Failed to update character ID: %s with name '%s'.", char_id, name, exc_info=True)
             raise e
         
     def update_character_name(self, char_id: int, new_name: str) -> None:
@@ -246,12 +307,14 @@ class CharacterRepository:
         """
         query = "UPDATE CHARACTERS SET Name = ? WHERE ID = ?;"
         try:
-            success = self.db._execute_commit(query, (new_name, char_id))
+            success = self._execute_commit(query, (new_name, char_id))
+            self._name_cache.pop(char_id, None)
+            self._details_cache.pop(char_id, None)
             if success:
-                logger.info(f"Updated character ID: {char_id}. New Name: '{new_name}'.")
+                logger.info("Updated character ID: %s. New Name: '%s'.", char_id, new_name)
             return success
         except DatabaseError as e:
-            logger.error(f"Failed to update character ID: {char_id} with name '{new_name}'.", exc_info=True)
+            logger.error("Failed to update character ID: %s with name '%s'.", char_id, new_name, exc_info=True)
             raise e
     def delete_character(self, char_id) -> bool:
         """
@@ -265,19 +328,20 @@ class CharacterRepository:
         """
         query = "DELETE FROM Characters WHERE ID = ?;"
         try:
-            success = self.db._execute_commit(query, (char_id,))
+            success = self._execute_commit(query, (char_id,))
+            self._name_cache.pop(char_id, None)
+            self._details_cache.pop(char_id, None)
             if success:
-                logger.warning(f"Character deleted: ID={char_id}.")
+                logger.warning("Character deleted: ID=%s.", char_id)
             return success
         except DatabaseError as e:
-            logger.error(f"Failed to delete character ID: {char_id}.", exc_info=True)
+            logger.error("Failed to delete character ID: %s.", char_id, exc_info=True)
             raise e
     
     def search_characters(self, user_query: str) -> CharacterBasicDict | None:
         """
-        Accepts a keyword query and performs a hybrid search:
-        1. Search on Name, Status (ranked results).
-        2. Merges and deduplicates the results, prioritizing FTS rank.
+        Accepts a keyword query and performs a case-insensitive substring 
+        search on Name and Status, ordered by Name.
 
         :param user_query: The users search query.
         :type user_query: str
@@ -290,66 +354,105 @@ class CharacterRepository:
         if not clean_query:
             return None
 
-        # Wildcard pattern for case-insensitive LIKE Search
-        like_pattern = f'%{clean_query}%'
-
-        query = """
-        SELECT DISTINCT ID, Name, Status
-        FROM Characters
-        WHERE
-            Name LIKE ? OR
-            Status LIKE ?
-        ORDER BY Name ASC;
-        """
-        params = (like_pattern, like_pattern)
+        # The trigram index matches the quoted query anywhere inside Name or Status
+        if len(clean_query) >= 3:
+            match_query = '"%s"' % clean_query.replace('"', '""')
+            query = """
+            SELECT ID, Name, Status
+            FROM Characters
+            WHERE ID IN (SELECT rowid FROM Characters_FTS WHERE Characters_FTS MATCH ?)
+            ORDER BY Name ASC;
+            """
+            params = (match_query,)
+        else:
+            # Queries shorter than a trigram cannot use the index, fall back to a 
+            # case-insensitive substring search. INSTR matches the query literally, 
+            # where LIKE would treat '%' and '_' as wildcards.
+            query = """
+            SELECT ID, Name, Status
+            FROM Characters
+            WHERE
+                INSTR(LOWER(Name), LOWER(?)) > 0 OR
+                INSTR(LOWER(Status), LOWER(?)) > 0
+            ORDER BY Name ASC;
+            """
+            params = (clean_query, clean_query)
         try:
-            results = self.db._execute_query(query, params, fetch_all=True)
-            logger.info(f"Character search for '{clean_query}' returned {len(results)} results.")
+            results = self._execute_query(query, params, fetch_all=True)
+            logger.info("Character search for '%s' returned %s results.", clean_query, len(results))
             return results
         except DatabaseError as e:
-            logger.error(f"Failed to execute search for characters with query: '{clean_query}'.", exc_info=True)
+            logger.error("Failed to execute search for characters with query: '%s'.", clean_query, exc_info=True)
             raise e
     
-    def get_all_characters_for_export(self, character_ids: list[int] = []) -> CharacterDetailsDict:
+    def get_all_characters_for_export(self, character_ids: list[int] = None,
+                                      columns: tuple[str, ...] | None = None) -> CharacterDetailsDict:
         """
         Retrieves characters details for export purposes,
         optionally filtered by a list of IDs.
 
         :param character_ids: A list of all the character IDs selected. Defaults
-            to Empty List which means all Character IDS are selected.
+            to None which means all Character IDS are selected.
+        :param columns: The columns to export. Defaults to None which means all 
+            export columns.
+        :type columns: tuple[str, ...] or None
 
         :returns: A dictionary of all the characters selected by ID.
         :rtype: :py:class:`~app.utils.types.CharacterDetailsDict`
         """
-        query = """
-        SELECT ID, Name, Description, Status, Age, Date_Of_Birth, 
-        Occupation_School, Physical_Description
+        results = list(self.iter_characters_for_export(character_ids, columns))
+        if character_ids:
+            logger.info("Retrieved %s characters for export from a list of %s IDs.",
+                        len(results), len(character_ids))
+        else:
+            logger.info("Retrieved all %s characters for export.", len(results))
+        return results
+
+    def iter_characters_for_export(self, character_ids: list[int] = None,
+                                   columns: tuple[str, ...] | None = None) -> Iterator[dict]:
+        """
+        Streams characters details for export purposes, optionally filtered by a list of IDs.
+
+        Characters are yielded one at a time from the database cursor, so the full 
+        result set is never materialized at once. Exports that only need a few 
+        fields can pass ``columns`` to skip reading the long description columns.
+
+        :param character_ids: A list of all the character IDs selected. Defaults
+            to None which means all Character IDS are selected.
+        :type character_ids: list[int]
+        :param columns: The columns to export, each one of the export columns. Defaults
+            to None which means all export columns.
+        :type columns: tuple[str, ...] or None
+
+        :returns: An iterator over the Character dicts, ordered by Name.
+        :rtype: Iterator[dict]
+        """
+        if columns is None:
+            columns = _EXPORT_COLUMNS
+        else:
+            # Column names are placed in the SQL text, so only known columns are accepted
+            unknown = [column for column in columns if column not in _EXPORT_COLUMNS]
+            if unknown or not columns:
+                raise ValueError(f"Invalid character export columns: {unknown or columns}")
+
+        query = f"""
+        SELECT {', '.join(columns)}
         FROM Characters
         """
         params = ()
 
         # Modify the query if specific IDs are requested
-        if character_ids is not None and character_ids:
-            # Ensure IDs are unique and sorted for consistent query execution
-            unique_ids = sorted(list(set(character_ids))) 
-            
-            # Create placeholders for the IN clause (e.g., ?, ?, ?)
-            placeholders = ', '.join(['?'] * len(unique_ids))
-            
-            query += f" WHERE ID IN ({placeholders})"
-            params = tuple(unique_ids)
+        if character_ids:
+            # Bind the IDs as a single JSON array so the query text is the same for any
+            # number of characters and stays under SQLite's host-parameter limit
+            query += " WHERE ID IN (SELECT value FROM json_each(?))"
+            params = (json.dumps(sorted({*character_ids})),)
 
         # Add final ordering clause
         query += " ORDER BY Name ASC;"
 
         try:
-            results = self.db._execute_query(query, params, fetch_all=True)
-            if character_ids:
-                logger.info(f"Retrieved {len(results)} characters for export from a list of "
-                            "{len(character_ids)} IDs.")
-            else:
-                logger.info(f"Retrieved all {len(results)} characters for export.")
-            return results if results else []
+            yield from self._execute_query_iter(query, params)
         except DatabaseError as e:
             logger.error("Failed to retrieve characters for export.", exc_info=True)
-            raise e
\ No newline at end of file
+            raise e
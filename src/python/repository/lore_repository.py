@@ -1,5 +1,9 @@
 # src/python/lore_repository.py
 
+import json
+from collections import OrderedDict
+from typing import Iterator
+
 from ..utils.types import LoreEntryDict, LoreSearchResultDict, DBRowList
 from ..db_connector import DBConnector
 from ..utils.logger import get_logger
@@ -7,6 +11,10 @@ from ..utils.exceptions import DatabaseError
 
 logger = get_logger(__name__)
 
+# Most lore entries whose details are kept in memory. Details include the full Content,
+# so the least recently used entries are dropped past this size.
+_DETAILS_CACHE_SIZE = 256
+
 class LoreRepository:
     """
     Manages all database operations for the Lore Entry entity.
@@ -25,6 +33,20 @@ class LoreRepository:
         :rtype: None
         """
         self.db = db_connector
+
+        # Bind the connector's execution methods once so hot lookups skip an attribute hop
+        self._execute_query = db_connector._execute_query
+        self._execute_query_iter = db_connector._execute_query_iter
+        self._execute_commit = db_connector._execute_commit
+        self._execute_many = db_connector._execute_many
+
+        # Sorted unique categories, cleared by the methods that add, change or delete entries
+        self._categories_cache: list[str] | None = None
+
+        # Lore entry details by ID in least-recently-used order, kept in sync by the methods
+        # that change or delete an entry
+        self._details_cache: OrderedDict[int, LoreEntryDict] = OrderedDict()
+
         logger.debug("LoreRepository initialized.")
 
     def get_all_lore_entries(self) -> DBRowList | None:
@@ -44,13 +66,40 @@ class LoreRepository:
         ORDER BY Sort_Order ASC, Title ASC;
         """
         try:
-            results = self.db._execute_query(query, fetch_all=True)
-            logger.info(f"Retrieved {len(results)} basic lore entry records.")
+            results = self._execute_query(query, fetch_all=True)
+            logger.info("Retrieved %s basic lore entry records.", len(results))
             return results
         except DatabaseError as e:
             logger.error("Failed to retrieve all lore entries.", exc_info=True)
             raise e
         
+    def get_lore_entry_children(self, parent_lore_id: int | None) -> DBRowList:
+        """
+        Retrieves the direct children of a Lore Entry, in outline order.
+
+        :param parent_lore_id: The ID of the parent Lore Entry, or None for the root entries.
+        :type parent_lore_id: int or None
+
+        :returns: A list of dictionaries, each containing the lore entry's ID, Title, 
+            Category, Parent_Lore_ID and Sort_Order.
+        :rtype: :py:class:`~app.utils.types.DBRowList`
+        """
+        # IS (rather than =) also matches NULL for the root entries, and both forms are
+        # answered from idx_lore_parent
+        query = """
+        SELECT ID, Title, Category, Parent_Lore_ID, Sort_Order
+        FROM Lore_Entries
+        WHERE Parent_Lore_ID IS ?
+        ORDER BY Sort_Order ASC, Title ASC;
+        """
+        try:
+            results = self._execute_query(query, (parent_lore_id,), fetch_all=True)
+            logger.debug("Retrieved %s children for lore entry ID: %s.", len(results), parent_lore_id)
+            return results
+        except DatabaseError as e:
+            logger.error("Failed to retrieve children for lore entry ID: %s.", parent_lore_id, exc_info=True)
+            raise e
+
     def get_all_lore_entry_titles(self) -> list[str]:
         """
         Retrieves a list of all lore entry titles.
@@ -60,11 +109,9 @@ class LoreRepository:
         """
         query = "SELECT Title FROM Lore_Entries;"
         try:
-            lore_dict = self.db._execute_query(query, fetch_all=True)
-            results = []
-            for lore in lore_dict:
-                results.append(lore['Title'])
-            logger.info(f"Retrieved {len(results)} of all Lore Entry Titles.")
+            rows = self._execute_query(query, fetch_all=True, as_list=True)
+            results = [title for (title,) in rows]
+            logger.info("Retrieved %s of all Lore Entry Titles.", len(results))
             return results
         except DatabaseError as e:
             logger.error("Failed to retrieve all lore entry titles.", exc_info=True)
@@ -80,14 +127,15 @@ class LoreRepository:
         :returns: A dictionary of the Lore Entry .
         :rtype: dict or None
         """ 
-        search_term = f"%{title.strip()}%"
-        query = "SELECT ID, Title, Content FROM Lore_Entries WHERE Title Like ? COLLATE NOCASE;"
+        # SQLite wraps the bound title in wildcards, so no pattern string is built per call
+        query = "SELECT ID, Title, Content FROM Lore_Entries WHERE Title LIKE '%' || ? || '%' COLLATE NOCASE;"
         try:
-            result = self.db._execute_query(query, (search_term,), fetch_all=True)
-            logger.debug(f"Retrieved content by title search: '{title}'. Found: {result is not None}")
+            result = self._execute_query(query, (title.strip(),), fetch_all=True)
+            logger.debug("Retrieved content by title search: '%s'. Found: %s", title, result is not None)
             return result
         except DatabaseError as e:
-            logger.error(f"Failed to retrieve content for lore entry title search: '{title}'.", exc_info=True)
+            logger.error("Failed to retrieve content for lore entry title search: '%s'.",
+                         title, exc_info=True)
             raise e
 
 
@@ -115,13 +163,39 @@ class LoreRepository:
         VALUES (?, ?, ?, ?, ?)
         """
         try:
-            lore_id = self.db._execute_commit(query, (title, content, category, parent_lore_id, 
+            lore_id = self._execute_commit(query, (title, content, category, parent_lore_id, 
                                                       sort_order), fetch_id=True)
+            self._categories_cache = None
             if lore_id:
-                logger.info(f"Created new lore entry: ID={lore_id}, Title='{title}'.")
+                logger.info("Created new lore entry: ID=%s, Title='%s'.", lore_id, title)
             return lore_id
         except DatabaseError as e:
-            logger.error(f"Failed to create new lore entry with title: '{title}'.", exc_info=True)
+            logger.error("Failed to create new lore entry with title: '%s'.", title, exc_info=True)
+            raise e
+    
+    def create_lore_entries_bulk(self, lore_entries: list[tuple[str, str, str, int | None, int]]) -> bool:
+        """
+        Inserts many new lore entry records in a single, atomic transaction.
+
+        :param lore_entries: A list of tuples, where each tuple is
+                             (title, content, category, parent_lore_id, sort_order).
+        :type lore_entries: list[tuple[str, str, str, int or None, int]]
+
+        :returns: True if all inserts succeed and the transaction commits.
+        :rtype: bool
+        """
+        query = """
+        INSERT INTO Lore_Entries (Title, Content, Category, Parent_Lore_ID, Sort_Order)
+        VALUES (?, ?, ?, ?, ?)
+        """
+        try:
+            success = self._execute_many(query, lore_entries)
+            self._categories_cache = None
+            if success:
+                logger.info("Created %s new lore entries.", len(lore_entries))
+            return success
+        except DatabaseError as e:
+            logger.error("Failed to create %s new lore entries.", len(lore_entries), exc_info=True)
             raise e
     
     def get_lore_entry_title(self, lore_id: int) -> str | None:
@@ -134,14 +208,43 @@ class LoreRepository:
         :return: returns the title of the lore entry or None if not found.
         :rtype: str or None
         """
+        # A title is usually asked for right after (or before) the entry's details
+        if lore_id in self._details_cache:
+            return self._details_cache[lore_id]['Title']
+
         query = "SELECT Title FROM Lore_Entries WHERE ID = ?"
         try:
-            result =  self.db._execute_query(query, (lore_id,), fetch_one=True)
-            title = result['Title'] if result else None
-            logger.debug(f"Retrieved title for lore entry ID: {lore_id}. Title: {title}")
+            result = self._execute_query(query, (lore_id,), fetch_one=True, as_list=True)
+            title = result[0] if result else None
+            logger.debug("Retrieved title for lore entry ID: %s. Title: %s", lore_id, title)
             return title
         except DatabaseError as e:
-            logger.error(f"Failed to retrieve title for lore entry ID: {lore_id}.", exc_info=True)
+            logger.error("Failed to retrieve title for lore entry ID: %s.", lore_id, exc_info=True)
+            raise e
+    
+    def get_lore_entry_titles_bulk(self, lore_ids: list[int]) -> dict[int, str]:
+        """
+        Retrieves the titles of several lore entries in a single query.
+
+        Used instead of calling :py:meth:`.get_lore_entry_title` once per entry 
+        when several titles are needed at once.
+
+        :param lore_ids: The IDs of the lore entries to get titles for.
+        :type lore_ids: list[int]
+
+        :returns: A dictionary mapping each found lore entry ID to its title.
+        :rtype: dict[int, str]
+        """
+        if not lore_ids:
+            return {}
+
+        query = "SELECT ID, Title FROM Lore_Entries WHERE ID IN (SELECT value FROM json_each(?));"
+        try:
+            rows = self._execute_query(query, (json.dumps(list(lore_ids)),), fetch_all=True, as_list=True)
+            logger.debug("Retrieved titles for %s of %s requested lore entries.", len(rows), len(lore_ids))
+            return dict(rows)
+        except DatabaseError as e:
+            logger.error("Failed to retrieve titles for lore entry IDs: %s.", lore_ids, exc_info=True)
             raise e
     
     def get_lore_entry_details(self, lore_id: int) -> LoreEntryDict | None:
@@ -159,12 +262,21 @@ class LoreRepository:
         FROM Lore_Entries
         WHERE ID = ?;
         """
+        if lore_id in self._details_cache:
+            self._details_cache.move_to_end(lore_id)
+            # Hand out a copy so callers editing the dict cannot change the cached row
+            return dict(self._details_cache[lore_id])
+
         try:
-            details = self.db._execute_query(query, (lore_id,), fetch_one=True)
-            logger.debug(f"Retrieved details for lore entry ID: {lore_id}. Found: {details is not None}")
+            details = self._execute_query(query, (lore_id,), fetch_one=True)
+            if details is not None:
+                self._details_cache[lore_id] = dict(details)
+                if len(self._details_cache) > _DETAILS_CACHE_SIZE:
+                    self._details_cache.popitem(last=False)
+            logger.debug("Retrieved details for lore entry ID: %s. Found: %s", lore_id, details is not None)
             return details
         except DatabaseError as e:
-            logger.error(f"Failed to retrieve details for lore entry ID: {lore_id}.", exc_info=True)
+            logger.error("Failed to retrieve details for lore entry ID: %s.", lore_id, exc_info=True)
             raise e
         
     def get_number_of_lore_entries(self) -> int:
@@ -176,15 +288,10 @@ class LoreRepository:
         :returns: The number of lore entries.
         :rtype: int
         """
-        query = "SELECT COUNT(*) FROM Lore_Entries;"
+        query = "SELECT COUNT(*) AS Count FROM Lore_Entries;"
         try:
-            result = self.db._execute_query(query, fetch_all=True)
-            try:
-                count = result[0]['COUNT(*)']
-            except:
-                count = 0
-
-            return count
+            result = self._execute_query(query, fetch_one=True)
+            return result['Count'] if result else 0
         
         except DatabaseError as e:
             logger.error("Failed to count all Lore Entries.", exc_info=True)
@@ -203,9 +310,13 @@ class LoreRepository:
         WHERE Category IS NOT NULL AND Category != '' 
         ORDER BY Category ASC;
         """
+        if self._categories_cache is not None:
+            return list(self._categories_cache)
+
         try:
-            results = self.db._execute_query(query, fetch_all=True)
-            return [row['Category'] for row in results] if results else []
+            results = self._execute_query(query, fetch_all=True, as_list=True)
+            self._categories_cache = [category for (category,) in results]
+            return list(self._categories_cache)
         except DatabaseError as e:
             logger.error("Failed to retrieve unique lore categories.", exc_info=True)
             raise e
@@ -226,15 +337,22 @@ class LoreRepository:
         :returns: True if successfully saved to dataase, otherwise False.
         :rtype: bool
         """
-        query = query = "UPDATE Lore_Entries SET Title = ?, Content = ?, Category = ? WHERE ID = ?;"
-        params = (title, content, category, lore_id)
+        # Saves that don't change anything (e.g. on every entry switch) match no row,
+        # so SQLite has no page to rewrite and the commit writes nothing to the journal.
+        query = """
+        UPDATE Lore_Entries SET Title = ?, Content = ?, Category = ? 
+        WHERE ID = ? AND (Title IS NOT ? OR Content IS NOT ? OR Category IS NOT ?);
+        """
+        params = (title, content, category, lore_id, title, content, category)
         try:
-            success = self.db._execute_commit(query, params)
+            success = self._execute_commit(query, params)
+            self._categories_cache = None
+            self._details_cache.pop(lore_id, None)
             if success:
-                logger.info(f"Updated lore entry ID: {lore_id}. New Title: '{title}'.")
+                logger.info("Updated lore entry ID: %s. New Title: '%s'.", lore_id, title)
             return success
         except DatabaseError as e:
-            logger.error(f"Failed to update lore entry ID: {lore_id} with title '{title}'.", exc_info=True)
+            logger.error("Failed to update lore entry ID: %s with title '%s'.", lore_id, title, exc_info=True)
             raise e
     
     def update_lore_entry_title(self, lore_id: int, new_title: str) -> bool:
@@ -252,12 +370,14 @@ class LoreRepository:
         query = "UPDATE Lore_Entries SET Title = ? WHERE ID = ?;"
         params = (new_title, lore_id)
         try:
-            success = self.db._execute_commit(query, params)
+            success = self._execute_commit(query, params)
+            self._details_cache.pop(lore_id, None)
             if success:
-                logger.info(f"Updated title for lore entry ID: {lore_id}. New title: '{new_title}'.")
+                logger.info("Updated title for lore entry ID: %s. New title: '%s'.", lore_id, new_title)
             return success
         except DatabaseError as e:
-            logger.error(f"Failed to update title for lore entry ID: {lore_id} to '{new_title}'.", exc_info=True)
+            logger.error("Failed to update title for lore entry ID: %s to '%s'.",
+                         lore_id, new_title, exc_info=True)
             raise e
     
     def update_lore_entry_parent_id(self, lore_id: int, new_parent_id: int | None) -> bool:
@@ -277,13 +397,13 @@ class LoreRepository:
         WHERE ID = ?;
         """
         try:
-            success = self.db._execute_commit(query, (new_parent_id, lore_id))
+            success = self._execute_commit(query, (new_parent_id, lore_id))
             if success:
-                logger.info(f"Updated parent ID for lore entry ID: {lore_id} to {new_parent_id}.")
+                logger.info("Updated parent ID for lore entry ID: %s to %s.", lore_id, new_parent_id)
             return success
         except DatabaseError as e:
-            logger.error(f"Failed to update parent ID for lore entry ID: {lore_id} to "
-                         f"{new_parent_id}.", exc_info=True)
+            logger.error("Failed to update parent ID for lore entry ID: %s to %s.",
+                         lore_id, new_parent_id, exc_info=True)
             raise e
         
     def update_lore_order(self, lore_id: int, sort_order: int) -> bool:
@@ -303,13 +423,37 @@ class LoreRepository:
         WHERE ID = ?;
         """
         try:
-            success = self.db._execute_commit(query, (sort_order, lore_id))
+            success = self._execute_commit(query, (sort_order, lore_id))
             if success:
-                logger.info(f"Updated parent ID for lore entry ID: {lore_id} to {sort_order}.")
+                logger.info("Updated parent ID for lore entry ID: %s to %s.", lore_id, sort_order)
             return success
         except DatabaseError as e:
-            logger.error(f"Failed to update parent ID for lore entry ID: {lore_id} to {sort_order}.",
-                         exc_info=True)
+            logger.error("Failed to update parent ID for lore entry ID: %s to %s.",
+                         lore_id, sort_order, exc_info=True)
+            raise e
+    
+    def reorder_lore_entries(self, lore_updates: list[tuple[int, int]]) -> bool:
+        """
+        Updates the Sort_Order for multiple lore entries in a single, atomic transaction.
+
+        :param lore_updates: A list of tuples, where each tuple is
+                             (lore_id, new_sort_order).
+        :type lore_updates: list[tuple[int, int]]
+
+        :returns: True if all updates succeed and the transaction commits.
+        :rtype: bool
+        """
+        # One prepared statement is executed for every (new_sort_order, lore_id) pair
+        query = "UPDATE Lore_Entries SET Sort_Order = ? WHERE ID = ?;"
+        params_seq = [(sort_order, lore_id) for lore_id, sort_order in lore_updates]
+
+        try:
+            success = self._execute_many(query, params_seq)
+            if success:
+                logger.info("Successfully reordered %s lore entries.", len(lore_updates))
+            return success
+        except DatabaseError as e:
+            logger.error("Failed to reorder lore entries. Attempted updates: %s.", lore_updates, exc_info=True)
             raise e
     
     def delete_lore_entry(self, lore_id: int) -> bool:
@@ -324,20 +468,23 @@ class LoreRepository:
         """
         query = "DELETE FROM Lore_Entries WHERE ID = ?;"
         try:
-            success = self.db._execute_commit(query, (lore_id,))
+            success = self._execute_commit(query, (lore_id,))
+            self._categories_cache = None
+            # Child entries are deleted by the cascade too, so drop every cached entry
+            self._details_cache.clear()
             if success:
-                logger.warning(f"Lore entry deleted: ID={lore_id}.")
+                logger.warning("Lore entry deleted: ID=%s.", lore_id)
             return success
         except DatabaseError as e:
-            logger.error(f"Failed to delete lore entry ID: {lore_id}.", exc_info=True)
+            logger.error("Failed to delete lore entry ID: %s.", lore_id, exc_info=True)
             raise e
     
     def search_lore_entries(self, user_query: str) -> list[LoreSearchResultDict] | None:
         """
         Accepts a keyword query and performs a hybrid search:
-        1. FTS on Title, Content, and Category (ranked results).
-        2. JOIN search on Tag names (unranked results).
-        3. Merges and deduplicates the results, prioritizing FTS rank.
+        1. FTS substring match on Title and Category.
+        2. Substring search on Tag names.
+        3. Merges the results, each Lore Entry appearing once, ordered by Title.
 
         :param user_query: The user's search query.
         :type user_query: str
@@ -350,28 +497,49 @@ class LoreRepository:
         if not clean_query:
             return None
 
-        # Wildcard pattern for case-insensitive LIKE Search
-        like_pattern = f'%{clean_query}%'
-
-        query = """
-        SELECT DISTINCT LE.ID, LE.Title, LE.Category, LE.Parent_Lore_ID
-        FROM Lore_Entries AS LE
-        LEFT JOIN Lore_Tags AS LT ON LE.ID = LT.Lore_ID
-        LEFT JOIN Tags AS T ON LT.Tag_ID = T.ID
-        WHERE
-            LE.Title LIKE ? OR
-            LE.Category LIKE ? OR
-            T.Name LIKE ?
-        ORDER BY LE.Title ASC;
-        """
-        params = (like_pattern, like_pattern, like_pattern)
+        # The trigram index matches the quoted query anywhere inside Title or Category
+        if len(clean_query) >= 3:
+            match_query = '"%s"' % clean_query.replace('"', '""')
+            query = """
+            SELECT LE.ID, LE.Title, LE.Category, LE.Parent_Lore_ID
+            FROM Lore_Entries AS LE
+            WHERE
+                LE.ID IN (SELECT rowid FROM Lore_Entries_FTS WHERE Lore_Entries_FTS MATCH ?) OR
+                LE.ID IN (
+                    SELECT LT.Lore_ID
+                    FROM Lore_Tags AS LT
+                    JOIN Tags AS T ON LT.Tag_ID = T.ID
+                    WHERE T.Name LIKE '%' || ? || '%'
+                )
+            ORDER BY LE.Title ASC;
+            """
+            params = (match_query, clean_query)
+        else:
+            # Queries shorter than a trigram cannot use the index, fall back to a 
+            # case-insensitive substring search on the columns themselves
+            query = """
+            SELECT LE.ID, LE.Title, LE.Category, LE.Parent_Lore_ID
+            FROM Lore_Entries AS LE
+            WHERE
+                INSTR(LOWER(LE.Title), LOWER(:query)) > 0 OR
+                INSTR(LOWER(LE.Category), LOWER(:query)) > 0 OR
+                LE.ID IN (
+                    SELECT LT.Lore_ID
+                    FROM Lore_Tags AS LT
+                    JOIN Tags AS T ON LT.Tag_ID = T.ID
+                    WHERE INSTR(LOWER(T.Name), LOWER(:query)) > 0
+                )
+            ORDER BY LE.Title ASC;
+            """
+            # The named parameter is bound once and shared by all three comparisons
+            params = {'query': clean_query}
         try:
-            results = self.db._execute_query(query, params, fetch_all=True)
-            logger.info(f"Lore search for '{clean_query}' returned {len(results)} results.")
+            results = self._execute_query(query, params, fetch_all=True)
+            logger.info("Lore search for '%s' returned %s results.", clean_query, len(results))
             return results
         except DatabaseError as e:
-            logger.error(f"Failed to execute search for lore entries with query: '{clean_query}'.", 
-                         exc_info=True)
+            logger.error("Failed to execute search for lore entries with query: '%s'.",
+                         clean_query, exc_info=True)
             raise e
     
     def get_lore_entries_for_export(self, lore_ids: list[int] = None) -> list[dict]:
@@ -385,6 +553,29 @@ class LoreRepository:
         :returns: A dictionary of all the lore entries selected by ID.
         :rtype: list[dict]
         """
+        results = list(self.iter_lore_entries_for_export(lore_ids))
+        if lore_ids:
+            logger.info("Retrieved %s lore entries for export from a list of %s IDs.", 
+                        len(results), len(lore_ids))
+        else:
+            logger.info("Retrieved all %s lore entries for export.", len(results))
+        return results
+
+    def iter_lore_entries_for_export(self, lore_ids: list[int] = None) -> Iterator[dict]:
+        """
+        Streams lore entry details (ID, Title, Content, Category) for export purposes,
+        optionally filtered by a list of IDs.
+
+        Lore entries are yielded one at a time from the database cursor, so only a 
+        single entry's content is held in memory at once.
+
+        :param lore_ids: A list of all the lore entry IDs selected. Defaults
+            to None which means all Lore Entry IDS are selected.
+        :type lore_ids: list[int]
+
+        :returns: An iterator over the Lore Entry dicts, ordered by Title.
+        :rtype: Iterator[dict]
+        """
         query = """
         SELECT ID, Title, Content, Category
         FROM Lore_Entries
@@ -392,28 +583,18 @@ class LoreRepository:
         params = ()
 
         # Modify the query if specific IDs are requested
-        if lore_ids is not None and lore_ids:
-            # Ensure IDs are unique and sorted for consistent query execution
-            unique_ids = sorted(list(set(lore_ids))) 
-            
-            # Create placeholders for the IN clause (e.g., ?, ?, ?)
-            placeholders = ', '.join(['?'] * len(unique_ids))
-            
-            query += f" WHERE ID IN ({placeholders})"
-            params = tuple(unique_ids)
+        if lore_ids:
+            # Bind the IDs as a single JSON array so the query text is the same for any
+            # number of lore entries and stays under SQLite's host-parameter limit
+            query += " WHERE ID IN (SELECT value FROM json_each(?))"
+            params = (json.dumps(sorted({*lore_ids})),)
 
         # Add final ordering clause
         query += " ORDER BY Title ASC;"
 
-        # Execute the query using the DBConnector helper method
+        # Stream the rows using the DBConnector helper method
         try:
-            results = self.db._execute_query(query, params, fetch_all=True)
-            if lore_ids:
-                logger.info(f"Retrieved {len(results)} lore entries for export from a list of "
-                            f"{len(lore_ids)} IDs.")
-            else:
-                logger.info(f"Retrieved all {len(results)} lore entries for export.")
-            return results if results else []
+            yield from self._execute_query_iter(query, params)
         except DatabaseError as e:
             logger.error("Failed to retrieve lore entries for export.", exc_info=True)
             raise e
\ No newline at end of file
@@ -1,5 +1,8 @@
 # src/python/repository/note_repository
 
+import json
+from typing import Iterator
+
 from ..db_connector import DBConnector
 from ..utils.logger import get_logger
 from ..utils.exceptions import DatabaseError
@@ -25,7 +28,14 @@ class NoteRepository:
         :rtype: None
         """
         self.db = db_connector
-        logger.debug("Tag Repository Initialized")
+
+        # Bind the connector's execution methods once so hot lookups skip an attribute hop
+        self._execute_query = db_connector._execute_query
+        self._execute_query_iter = db_connector._execute_query_iter
+        self._execute_commit = db_connector._execute_commit
+        self._execute_many = db_connector._execute_many
+
+        logger.debug("NoteRepository initialized.")
 
     def get_all_notes(self) -> dict:
         """
@@ -44,8 +54,8 @@ class NoteRepository:
         ORDER BY Sort_Order ASC;
         """
         try:
-            results = self.db._execute_query(query, fetch_all=True)
-            logger.info(f"Retrieved {len(results)} basic notes records.")
+            results = self._execute_query(query, fetch_all=True)
+            logger.info("Retrieved %s basic notes records.", len(results))
             return results
         except DatabaseError as e:
             logger.error("Failed to retrieve all basic notes.", exc_info=True)
@@ -65,11 +75,11 @@ class NoteRepository:
         """
         query = "SELECT Title, Content FROM Notes WHERE ID = ?;"
         try:
-            result = self.db._execute_query(query, (note_id,), fetch_one=True)
-            logger.debug(f"Retrieved content for Note ID: {note_id}.")
+            result = self._execute_query(query, (note_id,), fetch_one=True)
+            logger.debug("Retrieved content for Note ID: %s.", note_id)
             return result
         except DatabaseError as e:
-            logger.error(f"Failed to retrieve content for Note ID: {note_id}.", exc_info=True)
+            logger.error("Failed to retrieve content for Note ID: %s.", note_id, exc_info=True)
             raise e
         
     def get_note_title(self, note_id: int) -> str | None:
@@ -86,17 +96,42 @@ class NoteRepository:
         """
         query = "SELECT Title FROM Notes WHERE ID = ?;"
         try:
-            result = self.db._execute_query(query, (note_id,), fetch_one=True)
-            title = result['Title'] if result else None
-            logger.debug(f"Retrieved title for Note ID: {note_id}. Title: {title}")
+            result = self._execute_query(query, (note_id,), fetch_one=True, as_list=True)
+            title = result[0] if result else None
+            logger.debug("Retrieved title for Note ID: %s. Title: %s", note_id, title)
             return title
         except DatabaseError as e:
-            logger.error(f"Failed to retrieve title for Note ID: {note_id}.", exc_info=True)
+            logger.error("Failed to retrieve title for Note ID: %s.", note_id, exc_info=True)
+            raise e
+        
+    def get_note_titles_bulk(self, note_ids: list[int]) -> dict[int, str]:
+        """
+        Retrieves the titles of several notes in a single query.
+
+        Used instead of calling :py:meth:`.get_note_title` once per note 
+        when several titles are needed at once.
+
+        :param note_ids: The IDs of the notes to get titles for.
+        :type note_ids: list[int]
+
+        :returns: A dictionary mapping each found note ID to its title.
+        :rtype: dict[int, str]
+        """
+        if not note_ids:
+            return {}
+
+        query = "SELECT ID, Title FROM Notes WHERE ID IN (SELECT value FROM json_each(?));"
+        try:
+            rows = self._execute_query(query, (json.dumps(list(note_ids)),), fetch_all=True, as_list=True)
+            logger.debug("Retrieved titles for %s of %s requested notes.", len(rows), len(note_ids))
+            return dict(rows)
+        except DatabaseError as e:
+            logger.error("Failed to retrieve titles for note IDs: %s.", note_ids, exc_info=True)
             raise e
         
     def get_all_notes_for_export(self, note_ids: list[int] = None) -> list[dict]:
         """
-        Retrieves chapter details (ID, Title, Content, Parent_Node_ID, Sort_Order) for export purposes,
+        Retrieves note details (ID, Title, Content, Parent_Note_ID, Sort_Order) for export purposes,
         optionally filtered by a list of IDs.
 
         :param note_ids: A list of all the notes IDs that wish to be exported. Default
@@ -106,34 +141,47 @@ class NoteRepository:
         :returns: A list containing all note dicts.
         :rtype: list[dict]
         """
+        results = list(self.iter_notes_for_export(note_ids))
+        if note_ids:
+            logger.info("Retrieved %s Notes for export from a list of %s IDs.", len(results), len(note_ids))
+        else:
+            logger.info("Retrieved all %s Notes for export.", len(results))
+        return results
+
+    def iter_notes_for_export(self, note_ids: list[int] = None) -> Iterator[dict]:
+        """
+        Streams note details (ID, Title, Content, Parent_Note_ID, Sort_Order) for export 
+        purposes, optionally filtered by a list of IDs.
+
+        Notes are yielded one at a time from the database cursor, so only a 
+        single note's content is held in memory at once.
+
+        :param note_ids: A list of all the notes IDs that wish to be exported. Default
+            is None which results in all notes.
+        :type note_ids: list[int]
+
+        :returns: An iterator over the note dicts, ordered by Sort_Order.
+        :rtype: Iterator[dict]
+        """
         query = """
-        SELECT ID, Title, Content, Parent_Note_ID Sort_Order
+        SELECT ID, Title, Content, Parent_Note_ID, Sort_Order
         FROM Notes
         """
         params = ()
 
         # Modify the query if specific IDs are requested
-        if note_ids is not None and note_ids:
-            # Ensure IDs are unique and sorted for consistent query execution
-            unique_ids = sorted(list(set(note_ids)))
-
-            # Create placeholders for the IN clause (e.g., ?, ?, ?)
-            placeholders = ', '.join(['?'] * len(unique_ids))
-
-            query += f" WHERE ID IN ({placeholders})"
-            params = tuple(unique_ids)
+        if note_ids:
+            # Bind the IDs as a single JSON array so the query text is the same for any
+            # number of notes and stays under SQLite's host-parameter limit
+            query += " WHERE ID IN (SELECT value FROM json_each(?))"
+            params = (json.dumps(sorted({*note_ids})),)
 
         # Add final ordering clause
         query += " ORDER BY Sort_Order ASC;"
 
-        # Execute the query using the DBConnector helper method
+        # Stream the rows using the DBConnector helper method
         try:
-            results = self.db._execute_query(query, params, fetch_all=True)
-            if note_ids:
-                logger.info(f"Retrieved {len(results)} Notes for export from a list of {len(note_ids)} IDs.")
-            else:
-                logger.info(f"Retrieved all {len(results)} Notes for export.")
-            return results if results else []
+            yield from self._execute_query_iter(query, params)
         except DatabaseError as e:
             logger.error("Failed to retrieve Notes for export.", exc_info=True)
             raise e
@@ -161,12 +209,37 @@ class NoteRepository:
         VALUES (?, ?, ?, ?);
         """
         try:
-            note_id = self.db._execute_commit(query, (title, content, parent_note_id, sort_order), fetch_id=True)
+            note_id = self._execute_commit(query, (title, content, parent_note_id, sort_order), fetch_id=True)
             if note_id:
-                logger.info(f"Created new note: ID={note_id}, Title='{title}', SortOrder={sort_order}.")
+                logger.info("Created new note: ID=%s, Title='%s', SortOrder=%s.", note_id, title, sort_order)
             return note_id
         except DatabaseError as e:
-            logger.error(f"Failed to create new note with title: '{title}'.", exc_info=True)
+            logger.error("Failed to create new note with title: '%s'.", title, exc_info=True)
+            raise e
+        
+    def create_notes_bulk(self, notes: list[tuple[str, str, int | None, int]]) -> bool:
+        """
+        Inserts many new Note records in a single, atomic transaction.
+
+        :param notes: A list of tuples, where each tuple is
+                      (title, content, parent_note_id, sort_order).
+        :type notes: list[tuple[str, str, int | None, int]]
+
+        :returns: True if all inserts succeed and the transaction commits.
+        :rtype: bool
+        """
+        query = """
+        INSERT INTO Notes
+        (Title, Content, Parent_Note_ID, Sort_Order)
+        VALUES (?, ?, ?, ?);
+        """
+        try:
+            success = self._execute_many(query, notes)
+            if success:
+                logger.info("Created %s new notes.", len(notes))
+            return success
+        except DatabaseError as e:
+            logger.error("Failed to create %s new notes.", len(notes), exc_info=True)
             raise e
         
     def update_note_content(self, note_id: int, content: str) -> bool:
@@ -183,12 +256,12 @@ class NoteRepository:
         """
         query = "UPDATE Notes SET Content = ? WHERE ID = ?;"
         try:
-            success = self.db._execute_commit(query, (content, note_id))
+            success = self._execute_commit(query, (content, note_id))
             if success:
-                logger.info(f"Content updated for note ID: {note_id}.")
+                logger.info("Content updated for note ID: %s.", note_id)
             return success
         except DatabaseError as e:
-            logger.error(f"Failed to update content for note ID: {note_id}.", exc_info=True)
+            logger.error("Failed to update content for note ID: %s.", note_id, exc_info=True)
             raise e
         
     def delete_note(self, note_id: int) -> bool:
@@ -203,12 +276,12 @@ class NoteRepository:
         """
         query = "DELETE FROM Notes WHERE ID = ?;"
         try:
-            success = self.db._execute_commit(query, (note_id,))
+            success = self._execute_commit(query, (note_id,))
             if success:
-                logger.warning(f"Note deleted: ID={note_id}.")
+                logger.warning("Note deleted: ID=%s.", note_id)
             return success
         except DatabaseError as e:
-            logger.error(f"Failed to delete note ID: {note_id}.", exc_info=True)
+            logger.error("Failed to delete note ID: %s.", note_id, exc_info=True)
             raise e
         
     def update_note_title(self, note_id: int, title: str) -> bool:
@@ -227,12 +300,12 @@ class NoteRepository:
         """
         query = "UPDATE Notes SET Title = ? WHERE ID = ?;"
         try:
-            success = self.db._execute_commit(query, (title, note_id))
+            success = self._execute_commit(query, (title, note_id))
             if success:
-                logger.info(f"Title updated for note ID: {note_id}. New title: '{title}'.")
+                logger.info("Title updated for note ID: %s. New title: '%s'.", note_id, title)
             return success
         except DatabaseError as e:
-            logger.error(f"Failed to update title for note ID: {note_id}.", exc_info=True)
+            logger.error("Failed to update title for note ID: %s.", note_id, exc_info=True)
             raise e
         
     def update_note_parent_id(self, note_id: int, new_parent_id: int | None) -> bool:
@@ -252,12 +325,13 @@ class NoteRepository:
         WHERE ID = ?;
         """
         try:
-            success = self.db._execute_commit(query, (new_parent_id, note_id))
+            success = self._execute_commit(query, (new_parent_id, note_id))
             if success:
-                logger.info(f"Updated parent ID for note ID: {note_id} to {new_parent_id}.")
+                logger.info("Updated parent ID for note ID: %s to %s.", note_id, new_parent_id)
             return success
         except DatabaseError as e:
-            logger.error(f"Failed to update parent ID for note ID: {note_id} to {new_parent_id}.", exc_info=True)
+            logger.error("Failed to update parent ID for note ID: %s to %s.",
+                         note_id, new_parent_id, exc_info=True)
             raise note_id
         
     def update_note_order(self, note_id: int, sort_order: int) -> bool:
@@ -277,20 +351,21 @@ class NoteRepository:
         WHERE ID = ?;
         """
         try:
-            success = self.db._execute_commit(query, (sort_order, note_id))
+            success = self._execute_commit(query, (sort_order, note_id))
             if success:
-                logger.info(f"Updated parent ID for note ID: {note_id} to {sort_order}.")
+                logger.info("Updated parent ID for note ID: %s to %s.", note_id, sort_order)
             return success
         except DatabaseError as e:
-            logger.error(f"Failed to update parent ID for note ID: {note_id} to {sort_order}.", exc_info=True)
+            logger.error("Failed to update parent ID for note ID: %s to %s.",
+                         note_id, sort_order, exc_info=True)
             raise e
         
     def search_notes(self, user_query: str) -> list[dict] | None:
         """
         Accepts a keyword query and performs a hybrid search:
-        1. FTS on Title, Content, and Category (ranked results).
-        2. JOIN search on Tag names (unranked results).
-        3. Merges and deduplicates the results, prioritizing FTS rank.
+        1. Substring search on Title.
+        2. Substring search on Tag names.
+        3. Merges the results, each Note appearing once, ordered by Title.
 
         :param user_query: The user's search query.
         :type user_query: str
@@ -299,23 +374,27 @@ class NoteRepository:
         :rtype: list[dict]
         """
         clean_query = user_query.strip()
-        like_pattern = f'%{clean_query}%'
 
+        # Matching tags in a subquery returns each note once, without the duplicate rows
+        # a join over several matching tags would need DISTINCT to remove
         query = """
-        SELECT DISTINCT N.ID, N.Title, N.Parent_Note_ID
+        SELECT N.ID, N.Title, N.Parent_Note_ID
         FROM Notes AS N
-        LEFT JOIN Note_Tags AS NT ON N.ID = NT.Note_ID
-        LEFT JOIN Tags AS T ON NT.Tag_ID = T.ID
         WHERE
-            N.Title LIKE ? OR
-            T.Name LIKE ?
+            N.Title LIKE '%' || :query || '%' OR
+            N.ID IN (
+                SELECT NT.Note_ID
+                FROM Note_Tags AS NT
+                JOIN Tags AS T ON NT.Tag_ID = T.ID
+                WHERE T.Name LIKE '%' || :query || '%'
+            )
         ORDER BY N.Title ASC;
         """
-        params = (like_pattern, like_pattern)
+        params = {'query': clean_query}
         try:
-            results = self.db._execute_query(query, params, fetch_all=True)
-            logger.info(f"Note search for '{clean_query}' returned {len(results)} results.")
+            results = self._execute_query(query, params, fetch_all=True)
+            logger.info("Note search for '%s' returned %s results.", clean_query, len(results))
             return results
         except DatabaseError as e:
-            logger.error(f"Failed to execute search for notes with query: '{clean_query}'.", exc_info=True)
+            logger.error("Failed to execute search for notes with query: '%s'.", clean_query, exc_info=True)
             raise e
\ No newline at end of file
@@ -67,7 +67,7 @@ class RelationshipRepository:
         """
         try:
             results = self.db._execute_query(query, fetch_all=True)
-            logger.info(f"Retrieved {len(results)} character relationships for the graph.")
+            logger.info("Retrieved %s character relationships for the graph.", len(results))
             return results
         except DatabaseError as e:
             logger.error("Failed to retrieve all character relationships for graph.", exc_info=True)
@@ -87,10 +87,10 @@ class RelationshipRepository:
         try:
             rel_data = self.db._execute_query(query, (rel_id,), fetch_one=True)
             if rel_data:
-                logger.info(f"Got details for Relationship: ID={rel_id}.")
+                logger.info("Got details for Relationship: ID=%s.", rel_id)
             return rel_data
         except DatabaseError as e:
-            logger.error(f"Failed to get details for relationship with ID {rel_id}.", exc_info=True)
+            logger.error("Failed to get details for relationship with ID %s.", rel_id, exc_info=True)
             raise e
     
     def create_relationship(self, char_a_id: int, char_b_id: int, type_id: int, lore_id: int | None = None,
@@ -129,12 +129,12 @@ class RelationshipRepository:
         try:
             relationship_id = self.db._execute_commit(query, params, fetch_id=True)
             if relationship_id:
-                logger.info(f"Created new relationship: ID={relationship_id}, Type_ID={type_id}" 
-                            f" between Char {char_a_id} and Char {char_b_id}.")
+                logger.info("Created new relationship: ID=%s, Type_ID=%s between Char %s and Char %s.", 
+                            relationship_id, type_id, char_a_id, char_b_id)
             return relationship_id
         except DatabaseError as e:
-            logger.error(f"Failed to create relationship between {char_a_id} and {char_b_id} with "
-                         f"Type ID {type_id}.", exc_info=True)
+            logger.error("Failed to create relationship between %s and %s with Type ID %s.",
+                         char_a_id, char_b_id, type_id, exc_info=True)
             raise e
 
     def delete_relationship(self, relationship_id: int) -> bool:
@@ -151,10 +151,10 @@ class RelationshipRepository:
         try:
             success = self.db._execute_commit(query, (relationship_id,))
             if success:
-                logger.info(f"Character relationship deleted: ID={relationship_id}.")
+                logger.info("Character relationship deleted: ID=%s.", relationship_id)
             return success
         except DatabaseError as e:
-            logger.error(f"Failed to delete relationship ID: {relationship_id}.", exc_info=True)
+            logger.error("Failed to delete relationship ID: %s.", relationship_id, exc_info=True)
             raise e
 
     def update_relationship_details(self, relationship_id: int, type_id: int, description: str, 
@@ -193,11 +193,11 @@ class RelationshipRepository:
         try:
             success = self.db._execute_commit(query, params)
             if success:
-                logger.info(f"Character relationship details updated: ID={relationship_id}.")
+                logger.info("Character relationship details updated: ID=%s.", relationship_id)
             return success
 
         except DatabaseError as e:
-            logger.error(f"Failed to update relationship details, ID: {relationship_id}.", exc_info=True)
+            logger.error("Failed to update relationship details, ID: %s.", relationship_id, exc_info=True)
             raise e
          
 
@@ -226,7 +226,7 @@ class RelationshipRepository:
         """
         try:
             results = self.db._execute_query(query, fetch_all=True)
-            logger.debug(f"Retrieved {len(results)} node positions.")
+            logger.debug("Retrieved %s node positions.", len(results))
             return results
         except DatabaseError as e:
             logger.error("Failed to retrieve all character node positions.", exc_info=True)
@@ -244,10 +244,10 @@ class RelationshipRepository:
         query = "SELECT Node_Color, Node_Shape, Is_Hidden, Is_Locked FROM Character_Node_Positions WHERE Character_ID = ?;"
         try:
             results = self.db._execute_query(query, (char_id,), fetch_one=True)
-            logger.debug(f"Retrieved node details for char_id: {char_id}.")
+            logger.debug("Retrieved node details for char_id: %s.", char_id)
             return results
         except DatabaseError as e:
-            logger.error(f"Failed to retrieve node data for char_id: {char_id}.", exc_info=True)
+            logger.error("Failed to retrieve node data for char_id: %s.", char_id, exc_info=True)
             raise e
 
     def save_node_attributes(self, character_id: int, x_pos: float, y_pos: float, 
@@ -283,7 +283,7 @@ class RelationshipRepository:
         try:
             success = self.db._execute_commit(query, params)
             if success:
-                logger.info(f"Successfully saved node attributes, Char_ID: {character_id}")
+                logger.info("Successfully saved node attributes, Char_ID: %s", character_id)
             return success
         except DatabaseError as e:
             logger.warning("Failed to save character node attributes", exc_info=True)
@@ -316,7 +316,7 @@ class RelationshipRepository:
         try:
             success = self.db._execute_commit(query, params)
             if success:
-                logger.info(f"Successfully saved node details, Char_ID: {character_id}")
+                logger.info("Successfully saved node details, Char_ID: %s", character_id)
             return success
         except DatabaseError as e:
             logger.warning("Failed to save character node details", exc_info=True)
@@ -340,7 +340,7 @@ class RelationshipRepository:
         try:
             success = self.db._execute_commit(query, params)
             if success:
-                logger.info(f"Successfully saved new is_hidden attribute, Char_ID: {char_id}")
+                logger.info("Successfully saved new is_hidden attribute, Char_ID: %s", char_id)
             return success
         except DatabaseError as e:
             logger.warning("Failed to save character node new is_hidden attribute", exc_info=True)
@@ -364,7 +364,7 @@ class RelationshipRepository:
         try:
             success = self.db._execute_commit(query, params)
             if success:
-                logger.info(f"Successfully saved new is_locked attribute, Char_ID: {char_id}")
+                logger.info("Successfully saved new is_locked attribute, Char_ID: %s", char_id)
             return success
         except DatabaseError as e:
             logger.warning("Failed to save character node new is_locked attribute", exc_info=True)
@@ -387,7 +387,7 @@ class RelationshipRepository:
         try:
             success = self.db._execute_commit(query, params)
             if success:
-                logger.info(f"Successfully saved new is_locked attribute, Char_IDs: {char_ids}")
+                logger.info("Successfully saved new is_locked attribute, Char_IDs: %s", char_ids)
             return success
         except DatabaseError as e:
             logger.warning("Failed to save new IDS new is_locked attribute", exc_info=True)
@@ -411,7 +411,7 @@ class RelationshipRepository:
         """
         try:
             results = self.db._execute_query(query, fetch_all=True)
-            logger.debug(f"Retrieved {len(results)} relationship types.")
+            logger.debug("Retrieved %s relationship types.", len(results))
             return results
         except DatabaseError as e:
             logger.error("Failed to retrieve all relationship types.", exc_info=True)
@@ -435,7 +435,7 @@ class RelationshipRepository:
         try:
             success = self.db._execute_query(query, (type_id,), fetch_one=True)
             if success:
-                logger.info(f"Successfully got relationship types for {len(success)} character nodes.")
+                logger.info("Successfully got relationship types for %s character nodes.", len(success))
             return success
         except DatabaseError as e:
             logger.error("Failed to retrieve relationship types details.", exc_info=True)
@@ -470,10 +470,10 @@ class RelationshipRepository:
         try:
             type_id = self.db._execute_commit(query, params, fetch_id=True)
             if type_id:
-                logger.info(f"Created new relationship type: ID={type_id}, Name='{type_name}'.")
+                logger.info("Created new relationship type: ID=%s, Name='%s'.", type_id, type_name)
             return type_id
         except DatabaseError as e:
-            logger.error(f"Failed to create new relationship type with name: '{type_name}'.", exc_info=True)
+            logger.error("Failed to create new relationship type with name: '%s'.", type_name, exc_info=True)
             raise e
 
     def update_relationship_type(self, type_id: int, type_name: str, short_label: str, default_color: str, 
@@ -509,11 +509,11 @@ class RelationshipRepository:
         try:
             success = self.db._execute_commit(query, params)
             if success:
-                logger.info(f"Updated relationship type ID: {type_id}. New Name: '{type_name}'.")
+                logger.info("Updated relationship type ID: %s. New Name: '%s'.", type_id, type_name)
             return success
         except DatabaseError as e:
-            logger.error(f"Failed to update relationship type ID: {type_id} with name '{type_name}'.", 
-                         exc_info=True)
+            logger.error("Failed to update relationship type ID: %s with name '%s'.",
+                         type_id, type_name, exc_info=True)
             raise e
 
     def delete_relationship_type(self, type_id: int) -> bool:
@@ -527,11 +527,11 @@ class RelationshipRepository:
         try:
             success = self.db._execute_commit(query, (type_id,))
             if success:
-                logger.warning(f"Relationship type deleted: ID={type_id}. Associated relationships "
-                               "were also deleted.")
+                logger.warning("Relationship type deleted: ID=%s. Associated relationships "
+                               "were also deleted.", type_id)
             return success
         except DatabaseError as e:
-            logger.error(f"Failed to delete relationship type ID: {type_id}.", exc_info=True)
+            logger.error("Failed to delete relationship type ID: %s.", type_id, exc_info=True)
             raise e
 
     # =========================================================================
@@ -566,7 +566,7 @@ class RelationshipRepository:
         """
         try:
             results = self.db._execute_query(query, fetch_all=True)
-            logger.debug(f"Retrieved {len(results)} junctions for the graph.")
+            logger.debug("Retrieved %s junctions for the graph.", len(results))
             return results
         except DatabaseError as e:
             logger.error("Failed to retrieve junctions for graph.", exc_info=True)
@@ -600,7 +600,7 @@ class RelationshipRepository:
         """
         try:
             results = self.db._execute_query(query, fetch_all=True)
-            logger.debug(f"Retrieved {len(results)} junction connections.")
+            logger.debug("Retrieved %s junction connections.", len(results))
             return results
         except DatabaseError as e:
             logger.error("Failed to retrieve junction connections.", exc_info=True)
@@ -632,10 +632,10 @@ class RelationshipRepository:
         try:
             junction_id = self.db._execute_commit(query, params, fetch_id=True)
             if junction_id:
-                logger.info(f"Created new junction: ID={junction_id}, Type_ID={type_id}.")
+                logger.info("Created new junction: ID=%s, Type_ID=%s.", junction_id, type_id)
             return junction_id
         except DatabaseError as e:
-            logger.error(f"Failed to create junction with Type_ID={type_id}.", exc_info=True)
+            logger.error("Failed to create junction with Type_ID=%s.", type_id, exc_info=True)
             raise e
 
     def update_junction_position(self, junction_id: int, x: float, y: float) -> bool:
@@ -655,10 +655,10 @@ class RelationshipRepository:
         try:
             success = self.db._execute_commit(query, (x, y, junction_id))
             if success:
-                logger.debug(f"Updated junction position: ID={junction_id}, x={x}, y={y}.")
+                logger.debug("Updated junction position: ID=%s, x=%s, y=%s.", junction_id, x, y)
             return success
         except DatabaseError as e:
-            logger.error(f"Failed to update junction position: ID={junction_id}.", exc_info=True)
+            logger.error("Failed to update junction position: ID=%s.", junction_id, exc_info=True)
             raise e
 
     def delete_junction(self, junction_id: int) -> bool:
@@ -674,10 +674,10 @@ class RelationshipRepository:
         try:
             success = self.db._execute_commit(query, (junction_id,))
             if success:
-                logger.info(f"Deleted junction: ID={junction_id} (spokes cascade-deleted).")
+                logger.info("Deleted junction: ID=%s (spokes cascade-deleted).", junction_id)
             return success
         except DatabaseError as e:
-            logger.error(f"Failed to delete junction: ID={junction_id}.", exc_info=True)
+            logger.error("Failed to delete junction: ID=%s.", junction_id, exc_info=True)
             raise e
 
     # =========================================================================
@@ -723,12 +723,11 @@ class RelationshipRepository:
         try:
             conn_id = self.db._execute_commit(query, params, fetch_id=True)
             if conn_id:
-                logger.info(f"Created junction connection: ID={conn_id}, "
-                            f"Junction={junction_id}, Type={endpoint_type}.")
+                logger.info("Created junction connection: ID=%s, Junction=%s, Type=%s.", 
+                            conn_id, junction_id, endpoint_type)
             return conn_id
         except DatabaseError as e:
-            logger.error(f"Failed to create junction connection for junction {junction_id}.",
-                         exc_info=True)
+            logger.error("Failed to create junction connection for junction %s.", junction_id, exc_info=True)
             raise e
 
     def update_junction_connection(self, connection_id: int, intensity: int,
@@ -751,10 +750,10 @@ class RelationshipRepository:
         try:
             success = self.db._execute_commit(query, (intensity, description, connection_id))
             if success:
-                logger.info(f"Updated junction connection: ID={connection_id}.")
+                logger.info("Updated junction connection: ID=%s.", connection_id)
             return success
         except DatabaseError as e:
-            logger.error(f"Failed to update junction connection: ID={connection_id}.", exc_info=True)
+            logger.error("Failed to update junction connection: ID=%s.", connection_id, exc_info=True)
             raise e
 
     def delete_junction_connection(self, connection_id: int) -> bool:
@@ -770,10 +769,10 @@ class RelationshipRepository:
         try:
             success = self.db._execute_commit(query, (connection_id,))
             if success:
-                logger.info(f"Deleted junction connection: ID={connection_id}.")
+                logger.info("Deleted junction connection: ID=%s.", connection_id)
             return success
         except DatabaseError as e:
-            logger.error(f"Failed to delete junction connection: ID={connection_id}.", exc_info=True)
+            logger.error("Failed to delete junction connection: ID=%s.", connection_id, exc_info=True)
             raise e
 
     def delete_orphan_junctions(self) -> int:
@@ -797,7 +796,7 @@ class RelationshipRepository:
             self.db.conn.commit()
             count = cursor.rowcount
             if count:
-                logger.info(f"Deleted {count} orphan junction(s).")
+                logger.info("Deleted %s orphan junction(s).", count)
             return count
         except Exception as e:
             logger.error("Failed to delete orphan junctions.", exc_info=True)
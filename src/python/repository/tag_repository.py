@@ -56,7 +56,7 @@ class TagRepository:
             result = self.db._execute_query(query, (clean_name,), fetch_one=True)
             if result:
                 tag_id = result['ID']
-                logger.info(f"Retrieve Tag ID: {tag_id} by name: {tag_name}")
+                logger.info("Retrieve Tag ID: %s by name: %s", tag_id, tag_name)
                 return tag_id
             return None
         except DatabaseError as e:
@@ -82,10 +82,10 @@ class TagRepository:
         try:
             success =  self.db._execute_commit(query, (clean_name,), fetch_id=True)
             if success:
-                logger.info(f"Created tag with new ID {success}")
+                logger.info("Created tag with new ID %s", success)
             return success
         except DatabaseError as e:
-            logger.error(f"Failed to create new tag.", exc_info=True)
+            logger.error("Failed to create new tag.", exc_info=True)
             raise e
     
     # --- Chapter Tag Methods ---
@@ -109,10 +109,10 @@ class TagRepository:
         """
         try:
             results = self.db._execute_query(query, (chapter_id,), fetch_all=True, as_list=True)
-            logger.debug(f"Retrieved {len(results)} tags for chapter ID: {chapter_id}.")
+            logger.debug("Retrieved %s tags for chapter ID: %s.", len(results), chapter_id)
             return results
         except DatabaseError as e:
-            logger.error(f"Failed to retrieve tags for chapter ID: {chapter_id}.", exc_info=True)
+            logger.error("Failed to retrieve tags for chapter ID: %s.", chapter_id, exc_info=True)
             raise e
     
     def set_tags_for_chapter(self, chapter_id: int, tag_names: list[str]) -> bool:
@@ -142,11 +142,11 @@ class TagRepository:
         try:
             success = self.db._execute_transaction(operations)
             if success:
-                logger.info(f"Successfully set {len(tag_names)} tags for chapter ID: {chapter_id}.")
+                logger.info("Successfully set %s tags for chapter ID: %s.", len(tag_names), chapter_id)
             return success
         except DatabaseError as e:
-            logger.error(f"Failed to set tags for chapter ID: {chapter_id}. Tag list: {tag_names}", 
-                         exc_info=True)
+            logger.error("Failed to set tags for chapter ID: %s. Tag list: %s",
+                         chapter_id, tag_names, exc_info=True)
             raise e
               
     # --- Tags for Lore ---
@@ -170,10 +170,10 @@ class TagRepository:
         """
         try:
             results = self.db._execute_query(query, (lore_id,), fetch_all=True, as_list=True)
-            logger.debug(f"Retrieved {len(results)} tags for lore entry ID: {lore_id}.")
+            logger.debug("Retrieved %s tags for lore entry ID: %s.", len(results), lore_id)
             return results
         except DatabaseError as e:
-            logger.error(f"Failed to retrieve tags for lore entry ID: {lore_id}.", exc_info=True)
+            logger.error("Failed to retrieve tags for lore entry ID: %s.", lore_id, exc_info=True)
             raise e
     
     def set_tags_for_lore_entry(self, lore_id: int, tag_names: list[str]) -> bool:
@@ -203,11 +203,11 @@ class TagRepository:
         try:
             success = self.db._execute_transaction(operations)
             if success:
-                logger.info(f"Successfully set {len(tag_names)} tags for lore entry ID: {lore_id}.")
+                logger.info("Successfully set %s tags for lore entry ID: %s.", len(tag_names), lore_id)
             return success
         except DatabaseError as e:
-            logger.error(f"Failed to set tags for lore entry ID: {lore_id}. Tag list: {tag_names}", 
-                         exc_info=True)
+            logger.error("Failed to set tags for lore entry ID: %s. Tag list: %s",
+                         lore_id, tag_names, exc_info=True)
             raise e
         
     # --- Tags for Notes ---
@@ -231,10 +231,10 @@ class TagRepository:
         """
         try:
             results = self.db._execute_query(query, (note_id,), fetch_all=True, as_list=True)
-            logger.debug(f"Retrieved {len(results)} tags for note ID: {note_id}.")
+            logger.debug("Retrieved %s tags for note ID: %s.", len(results), note_id)
             return results
         except DatabaseError as e:
-            logger.error(f"Failed to retrieve tags for note ID: {note_id}.", exc_info=True)
+            logger.error("Failed to retrieve tags for note ID: %s.", note_id, exc_info=True)
             raise e
     
     def set_tags_for_note(self, note_id: int, tag_names: list[str]) -> bool:
@@ -264,8 +264,9 @@ class TagRepository:
         try:
             success = self.db._execute_transaction(operations)
             if success:
-                logger.info(f"Successfully set {len(tag_names)} tags for note ID: {note_id}.")
+                logger.info("Successfully set %s tags for note ID: %s.", len(tag_names), note_id)
             return success
         except DatabaseError as e:
-            logger.error(f"Failed to set tags for note ID: {note_id}. Tag list: {tag_names}", exc_info=True)
+            logger.error("Failed to set tags for note ID: %s. Tag list: %s",
+                         note_id, tag_names, exc_info=True)
             raise e
\ No newline at end of file
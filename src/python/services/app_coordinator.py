@@ -502,8 +502,13 @@ class AppCoordinator(QObject):
         map = {EntityType.CHAPTER: ViewType.CHAPTER_EDITOR, EntityType.LORE: ViewType.LORE_EDITOR,
                 EntityType.CHARACTER: ViewType.CHARACTER_EDITOR, EntityType.NOTE: ViewType.NOTE_EDITOR}
 
-        bus.publish(Events.VIEW_SWITCH_REQUESTED, data={'view_type': map.get(entity_type)})
-        bus.publish(Events.NEW_ITEM_CREATED, data={'entity_type': entity_type, 'ID': id})
+        # Switching views reloads the whole outline, so when the Chapter view is already active
+        # the Chapter outline inserts the single new item itself instead.
+        if not (entity_type == EntityType.CHAPTER and self.current_entity_type == EntityType.CHAPTER):
+            bus.publish(Events.VIEW_SWITCH_REQUESTED, data={'view_type': map.get(entity_type)})
+        bus.publish(Events.NEW_ITEM_CREATED, data={
+            'entity_type': entity_type, 'ID': id, 'title': data.get('title')
+        })
 
     # --- Deleting Items ---
 
@@ -543,6 +548,12 @@ class AppCoordinator(QObject):
                 case EntityType.RELATIONSHIP:
                     self.relationship_repo.delete_relationship_type(id)
 
+        # The Chapter outline removes the single deleted item itself instead of reloading
+        if entity_type == EntityType.CHAPTER:
+            if check:
+                bus.publish(Events.ITEM_DELETED, data={'entity_type': entity_type, 'ID': id})
+            return
+
         bus.publish(Events.OUTLINE_LOAD_REQUESTED, data={'entity_type': entity_type})
 
     # --- Searching Items ---
@@ -636,6 +647,8 @@ class AppCoordinator(QObject):
         match view:
             case ViewType.CHAPTER_EDITOR:
                 success = self.chapter_repo.reorder_chapters(updates)
+            case ViewType.LORE_EDITOR:
+                success = self.lore_repo.reorder_lore_entries(updates)
 
         if not success:
             QMessageBox.critical(data.get('editor'), "Reordering Error", "Database update failed.")
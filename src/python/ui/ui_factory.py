@@ -12,13 +12,15 @@ from .views.note_outline_manager import NoteOutlineManager
 from .views.note_editor import NoteEditor
 from .views.relationship_outline_manager import RelationshipOutlineManager
 from .views.relationship_editor import RelationshipEditor
+from ..services.settings_manager import SettingsManager
 
 class UIFactory:
     """
     Handles the instantiation of all major UI components for MainWindow.
     """
     @staticmethod
-    def create_components(project_title: str, settings: dict) -> dict:
+    def create_components(project_title: str, settings: dict,
+                          settings_manager: SettingsManager | None = None) -> dict:
         """
         Instantiates all editors and outlines.
         
@@ -26,6 +28,8 @@ class UIFactory:
         :type: project_title: str
         :param settings: The dictionary of settings
         :type settings: dict
+        :param settings_manager: The settings manager, used by outlines to persist their state.
+        :type settings_manager: :py:class:`~app.services.settings_manager.SettingsManager` or None
 
         :returns: a dictionary containing the stacks and the individual editors.
         :rtype: dict
@@ -35,13 +39,13 @@ class UIFactory:
             'chapter_outline': ChapterOutlineManager(project_title=project_title),
             'chapter_editor': ChapterEditor(settings),
             
-            'lore_outline': LoreOutlineManager(project_title=project_title),
+            'lore_outline': LoreOutlineManager(project_title=project_title, settings_manager=settings_manager),
             'lore_editor': LoreEditor(settings),
             
             'character_outline': CharacterOutlineManager(project_title=project_title),
             'character_editor': CharacterEditor(settings),
             
-            'note_outline': NoteOutlineManager(project_title=project_title),
+            'note_outline': NoteOutlineManager(project_title=project_title, settings_manager=settings_manager),
             'note_editor': NoteEditor(settings),
 
             'relationship_outline': RelationshipOutlineManager(),
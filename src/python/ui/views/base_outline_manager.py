@@ -2,12 +2,13 @@
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QLineEdit, QFrame, 
-    QTreeWidget, QTreeWidgetItem
+    QTreeWidget, QTreeWidgetItem, QTreeWidgetItemIterator
 )
 from PySide6.QtCore import Qt, Signal, QPoint
 
 from ..widgets.nested_tree_widget import NestedTreeWidget
 from ..widgets.reordering_tree_widget import ReorderingTreeWidget
+from ...services.settings_manager import SettingsManager
 from ...utils.constants import EntityType
 from ...utils.events import Events
 from ...utils.event_bus import bus, receiver
@@ -20,7 +21,8 @@ class BaseOutlineManager(QWidget):
 
     def __init__(self, project_title: str, header_text: str, id_role: int,
                  search_placeholder: str = "Search...", is_nested_tree: bool = False,
-                 type: EntityType = None, parent = None) -> None:
+                 type: EntityType = None, settings_manager: SettingsManager | None = None,
+                 parent = None) -> None:
         """
         Initializes the BaseOutlineManager
         
@@ -35,6 +37,9 @@ class BaseOutlineManager(QWidget):
         :param is_nested_tree: True if self.tree_widget is nested (Utilizing NestedTreeWidget)
             False if not nested (Utilizing QTreeWidget). Default is False.
         :type is_nested_tree: bool
+        :param settings_manager: The settings manager used to persist which items are 
+            collapsed. Default is None, which keeps them for the session only.
+        :type settings_manager: :py:class:`~app.services.settings_manager.SettingsManager` or None
         :param parent: The parent object.
         :type parent: :py:class:`~PySide6.QtWidgets.QWidget`
 
@@ -50,6 +55,15 @@ class BaseOutlineManager(QWidget):
         self.project_title = project_title
         self.id_role = id_role
 
+        # IDs of the items the user has collapsed, re-applied after each outline load.
+        # Saved under one settings key per outline type, mapping project title to IDs.
+        self.settings_manager = settings_manager
+        self._collapsed_key = f"collapsed_{str(type).lower().replace(' ', '_')}_ids"
+        self._collapsed_ids: set[int] = set()
+        if settings_manager:
+            saved = settings_manager.load_settings().get(self._collapsed_key, {})
+            self._collapsed_ids = set(saved.get(project_title, []))
+
         # --- Layout Setup ---
         self.main_layout = QVBoxLayout(self)
         self.main_layout.setContentsMargins(0, 0, 0, 0)
@@ -105,10 +119,100 @@ class BaseOutlineManager(QWidget):
         self.tree_widget.setSelectionMode(QTreeWidget.SelectionMode.SingleSelection)
         self.tree_widget.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
 
+        # Every row is a single line of text with an icon, so Qt can reuse one cached row
+        # height instead of measuring each item, and skip per-frame expand animations.
+        self.tree_widget.setUniformRowHeights(True)
+        self.tree_widget.setAnimated(False)
+
         # Signal Connections
         self.tree_widget.itemClicked.connect(self._on_item_clicked)
         self.tree_widget.itemChanged.connect(self._handle_item_renamed)
         self.tree_widget.customContextMenuRequested.connect(self._show_context_menu)
+        self.tree_widget.itemCollapsed.connect(self._on_item_collapsed)
+        self.tree_widget.itemExpanded.connect(self._on_item_expanded)
+
+    def _on_item_collapsed(self, item: QTreeWidgetItem) -> None:
+        """
+        Remembers that the user collapsed an item so the collapse survives reloads.
+        
+        :param item: The collapsed tree item.
+        :type item: :py:class:`~PySide6.QtWidgets.QTreeWidgetItem`
+
+        :rtype: None
+        """
+        item_id = item.data(0, self.id_role)
+        if item_id is not None:
+            self._collapsed_ids.add(item_id)
+
+    def _on_item_expanded(self, item: QTreeWidgetItem) -> None:
+        """
+        Forgets a previously collapsed item once the user expands it again.
+        
+        :param item: The expanded tree item.
+        :type item: :py:class:`~PySide6.QtWidgets.QTreeWidgetItem`
+
+        :rtype: None
+        """
+        self._collapsed_ids.discard(item.data(0, self.id_role))
+
+    @receiver(Events.APP_SHUTDOWN_INITIATED)
+    def _save_collapsed_ids(self, data: dict = None) -> None:
+        """
+        Saves the collapsed item IDs for this project when the app shuts down, then 
+        unregisters from the event bus so a closed project's outline does not save again.
+
+        This runs after the main window has saved its settings, so those are 
+        merged rather than overwritten.
+        
+        :param data: Empty dict. Needed for Event Bus
+        :type data: dict
+
+        :rtype: None
+        """
+        bus.unregister_instance(self)
+        if not self.settings_manager:
+            return
+
+        projects = self.settings_manager.load_settings().get(self._collapsed_key, {})
+        if self._collapsed_ids:
+            projects[self.project_title] = sorted(self._collapsed_ids)
+        else:
+            projects.pop(self.project_title, None)
+        self.settings_manager.save_setting(self._collapsed_key, projects)
+
+    def _expand_outline(self, restore_collapsed: bool = True) -> None:
+        """
+        Expands the whole outline with a single recursive :py:meth:`expandAll` call, 
+        then collapses only the items the user had collapsed before the reload.
+
+        Qt's recursive expand avoids the per-item relayout of expanding each item 
+        individually, so this stays fast as outlines grow deeper.
+
+        :param restore_collapsed: If True, re-collapses the user's collapsed items and 
+            forgets IDs that are no longer in the outline. False for search results, 
+            which are shown fully expanded. Default is True.
+        :type restore_collapsed: bool
+
+        :rtype: None
+        """
+        self.tree_widget.blockSignals(True)
+        self.tree_widget.expandAll()
+
+        if restore_collapsed and self._collapsed_ids:
+            found_ids = set()
+            iterator = QTreeWidgetItemIterator(self.tree_widget)
+            while iterator.value():
+                item = iterator.value()
+                item_id = item.data(0, self.id_role)
+                if item_id in self._collapsed_ids:
+                    item.setExpanded(False)
+                    found_ids.add(item_id)
+                iterator += 1
+
+            # Drop the IDs of items deleted since they were collapsed
+            self._collapsed_ids = found_ids
+
+        self.tree_widget.blockSignals(False)
 
     def _on_item_clicked(self, item: QTreeWidgetItem, column: int) -> None:
         """
@@ -3,7 +3,7 @@
 from PySide6.QtWidgets import (
     QTreeWidgetItem, QTreeWidgetItemIterator, QMenu, QInputDialog, QMessageBox
 )
-from PySide6.QtCore import Qt, QPoint
+from PySide6.QtCore import Qt, QPoint, QTimer
 from PySide6.QtGui import QIcon
 
 from .base_outline_manager import BaseOutlineManager
@@ -24,6 +24,9 @@ class ChapterOutlineManager(BaseOutlineManager):
     CHAPTER_ID_ROLE = Qt.ItemDataRole.UserRole + 1
     """The int role used to store the database ID of a Chapter on an item."""
 
+    RENAME_DEBOUNCE_MS = 250
+    """The int delay in milliseconds used to coalesce rapid renames of a Chapter into one save."""
+
     def __init__(self, project_title: str = "Forgerly Project") -> None:
         """
         Initializes the ChapterOutlineManager.
@@ -44,6 +47,22 @@ class ChapterOutlineManager(BaseOutlineManager):
 
         bus.register_instance(self)
 
+        self._chapter_icon = QIcon(":icons/chapter.svg")
+
+        # One single-shot timer per chapter being renamed, keyed by chapter ID
+        self._rename_timers: dict[int, QTimer] = {}
+
+        # The context menu is built once; the chapter actions carry the clicked chapter's ID
+        self._ctx_menu = QMenu(self)
+        self._new_action = self._ctx_menu.addAction("Add New Chapter...")
+        self._rename_action = self._ctx_menu.addAction("Rename Chapter")
+        self._delete_action = self._ctx_menu.addAction("Delete Chapter")
+
+        self._new_action.triggered.connect(self.prompt_and_add_chapter)
+        self._rename_action.triggered.connect(self._rename_context_chapter)
+        # Wrap the delete action to ensure save check occurs
+        self._delete_action.triggered.connect(self._delete_context_chapter)
+
         self.tree_widget.order_changed.connect(self._update_sort_orders)
 
     @receiver(Events.OUTLINE_DATA_LOADED)
@@ -61,19 +80,36 @@ class ChapterOutlineManager(BaseOutlineManager):
         if entity_type != EntityType.CHAPTER or not chapter_data: 
             return
 
-        self.tree_widget.clear()
+        # Build every item detached from the tree and attach them in one call, with
+        # signals and repaints suspended so clearing and populating the tree doesn't
+        # fire itemChanged (a spurious rename) or relayout once per chapter.
+        self.tree_widget.setUpdatesEnabled(False)
         self.tree_widget.blockSignals(True)
 
-        chapter_icon = QIcon(":icons/chapter.svg")
-
-        for chapter in chapter_data:
-            item = QTreeWidgetItem([chapter['Title']])
-            item.setData(0, self.id_role, chapter['ID'])
-            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsEditable)
-            item.setIcon(0, chapter_icon)
-            self.tree_widget.addTopLevelItem(item)
+        self.tree_widget.clear()
+        items = [self._create_chapter_item(chapter['ID'], chapter['Title']) for chapter in chapter_data]
+        self.tree_widget.addTopLevelItems(items)
 
         self.tree_widget.blockSignals(False)
+        self.tree_widget.setUpdatesEnabled(True)
+
+    def _create_chapter_item(self, chapter_id: int, title: str) -> QTreeWidgetItem:
+        """
+        Builds a single editable chapter item for the outline tree.
+        
+        :param chapter_id: The database ID of the chapter.
+        :type chapter_id: int
+        :param title: The title of the chapter.
+        :type title: str
+
+        :returns: The new chapter item.
+        :rtype: :py:class:`~PySide6.QtWidgets.QTreeWidgetItem`
+        """
+        item = QTreeWidgetItem([title])
+        item.setData(0, self.id_role, chapter_id)
+        item.setFlags(item.flags() | Qt.ItemFlag.ItemIsEditable)
+        item.setIcon(0, self._chapter_icon)
+        return item
 
     def _update_sort_orders(self) -> None:
         """
@@ -120,6 +156,40 @@ class ChapterOutlineManager(BaseOutlineManager):
                 bus.publish(Events.OUTLINE_LOAD_REQUESTED, data={'entity_type': EntityType.CHAPTER})
             return
         
+        timer = self._rename_timers.get(chapter_id)
+        if timer is None:
+            timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.setInterval(self.RENAME_DEBOUNCE_MS)
+            timer.timeout.connect(lambda: self._save_chapter_title(chapter_id))
+            self._rename_timers[chapter_id] = timer
+
+        # Restarting the timer coalesces rapid successive renames into a single save
+        timer.start()
+
+    def _save_chapter_title(self, chapter_id: int) -> None:
+        """
+        Saves the current title of a chapter once its rename debounce timer fires.
+
+        The title is re-read from the tree so only the final value is written.
+
+        :param chapter_id: The ID of the renamed chapter.
+        :type chapter_id: int
+
+        :rtype: None
+        """
+        timer = self._rename_timers.pop(chapter_id, None)
+        if timer is not None:
+            timer.deleteLater()
+
+        item = self.find_chapter_item_by_id(chapter_id)
+        if item is None:
+            return
+
+        new_title = item.text(0).strip()
+        if not new_title:
+            return
+
         bus.publish(Events.OUTLINE_NAME_CHANGE, data={
             'entity_type': EntityType.CHAPTER, 'ID': chapter_id, 'new_title': new_title
         })
@@ -135,28 +205,37 @@ class ChapterOutlineManager(BaseOutlineManager):
         :rtype: None
         """
         item = self.tree_widget.itemAt(pos)
+        chapter_id = item.data(0, self.id_role) if item else None
 
-        menu = QMenu(self)
-        
-        # New Chapter Button
-        new_action = menu.addAction("Add New Chapter...")
-        new_action.triggered.connect(self.prompt_and_add_chapter)
-
-        if item:            
-            is_chapter = item.data(0, self.id_role) is not None
-        
-            # Actions for Chapters (visible if clicking a chapter item)
-            if is_chapter:
-                rename_action = menu.addAction("Rename Chapter")
-                delete_action = menu.addAction("Delete Chapter")
-                
-                rename_action.triggered.connect(lambda: self.tree_widget.editItem(item, 0))
-                # Wrap the delete action to ensure save check occurs
-                delete_action.triggered.connect(lambda: self.check_save_and_delete(item))
+        # Actions for Chapters (visible if clicking a chapter item)
+        is_chapter = chapter_id is not None
+        self._rename_action.setVisible(is_chapter)
+        self._delete_action.setVisible(is_chapter)
+        self._rename_action.setData(chapter_id)
+        self._delete_action.setData(chapter_id)
 
         # Show the menu
-        if menu.actions():
-            menu.exec(self.tree_widget.mapToGlobal(pos))
+        self._ctx_menu.exec(self.tree_widget.mapToGlobal(pos))
+
+    def _rename_context_chapter(self) -> None:
+        """
+        Starts editing the title of the chapter the context menu was opened on.
+
+        :rtype: None
+        """
+        item = self.find_chapter_item_by_id(self._rename_action.data())
+        if item is not None:
+            self.tree_widget.editItem(item, 0)
+
+    def _delete_context_chapter(self) -> None:
+        """
+        Saves and deletes the chapter the context menu was opened on.
+
+        :rtype: None
+        """
+        item = self.find_chapter_item_by_id(self._delete_action.data())
+        if item is not None:
+            self.check_save_and_delete(item)
 
     @receiver(Events.NEW_CHAPTER_REQUESTED)
     def prompt_and_add_chapter(self, data: dict = None) -> None:
@@ -187,10 +266,11 @@ class ChapterOutlineManager(BaseOutlineManager):
     @receiver(Events.NEW_ITEM_CREATED)
     def _select_new_chapter(self, data: dict) -> None:
         """
-        Selects the newly created chapter.
+        Appends the newly created chapter to the end of the outline (if not already
+        present) and selects it, without reloading the whole outline.
         
         :param data: A dictionary of the needed data containing {type: EntityType.Chapter,
-        ID: int}
+        ID: int, title: str}
         :type data: dict
 
         :rtype: None
@@ -202,12 +282,38 @@ class ChapterOutlineManager(BaseOutlineManager):
         if not id:
             return
         
-        bus.publish(Events.OUTLINE_LOAD_REQUESTED, data={'entity_type': EntityType.CHAPTER})
-        
+        # The item is already present if a view switch reloaded the outline
         new_item = self.find_chapter_item_by_id(id)
-        if new_item:
-            self.tree_widget.setCurrentItem(new_item)
-            self._on_item_clicked(new_item, 0)
+        if new_item is None:
+            self.tree_widget.blockSignals(True)
+            new_item = self._create_chapter_item(id, data.get('title') or "")
+            self.tree_widget.addTopLevelItem(new_item)
+            self.tree_widget.blockSignals(False)
+
+        self.tree_widget.setCurrentItem(new_item)
+        self._on_item_clicked(new_item, 0)
+
+    @receiver(Events.ITEM_DELETED)
+    def _remove_deleted_chapter(self, data: dict) -> None:
+        """
+        Removes a deleted chapter's item from the outline without reloading the 
+        whole outline.
+        
+        :param data: A dictionary of the needed data containing {type: EntityType.Chapter,
+        ID: int}
+        :type data: dict
+
+        :rtype: None
+        """
+        if data.get('entity_type') != EntityType.CHAPTER:
+            return
+
+        item = self.find_chapter_item_by_id(data.get('ID'))
+        if item is None:
+            return
+
+        index = self.tree_widget.indexOfTopLevelItem(item)
+        self.tree_widget.takeTopLevelItem(index)
 
 
     def _delete_chapter(self, item: QTreeWidgetItem) -> None:
@@ -44,6 +44,8 @@ class CharacterOutlineManager(BaseOutlineManager):
 
         bus.register_instance(self)
 
+        self._character_icon = QIcon(":icons/character.svg")
+
         # Turn off Drag and Drop for tree widget
         self.tree_widget.setDragEnabled(True)
         self.tree_widget.setAcceptDrops(True)
@@ -73,11 +75,11 @@ class CharacterOutlineManager(BaseOutlineManager):
             item = QTreeWidgetItem([name])
             item.setData(0, self.id_role, character["ID"])
             item.setFlags(item.flags() | Qt.ItemFlag.ItemIsEditable)
-            item.setIcon(0, QIcon(":icons/character.svg"))
+            item.setIcon(0, self._character_icon)
 
             self.tree_widget.addTopLevelItem(item)
 
-        self.tree_widget.expandAll()
+        self._expand_outline()
 
     def _handle_item_renamed(self, item: QTreeWidgetItem, column: int) -> None:
         """
@@ -8,6 +8,7 @@ from PySide6.QtGui import QIcon
 from typing import Any
 
 from .base_outline_manager import BaseOutlineManager
+from ...services.settings_manager import SettingsManager
 from ...resources_rc import *
 from ...utils.constants import EntityType
 from ...utils.events import Events
@@ -24,7 +25,8 @@ class LoreOutlineManager(BaseOutlineManager):
     LORE_ID_ROLE = Qt.ItemDataRole.UserRole + 1
     """The int role used to store the database ID of a Lore Entry on an item."""
 
-    def __init__(self, project_title: str = "Forgerly Project") -> None:
+    def __init__(self, project_title: str = "Forgerly Project",
+                 settings_manager: SettingsManager | None = None) -> None:
         """
         Initializes the :py:class:`.LoreOutlineManager`.
         
@@ -33,6 +35,9 @@ class LoreOutlineManager(BaseOutlineManager):
         :param lore_repository: The repository object for Lore Entry CRUD operations.
         :type lore_repository: :py:class:`.LoreRepository` or None, optional
 
+        :param settings_manager: The settings manager used to persist collapsed items.
+        :type settings_manager: :py:class:`~app.services.settings_manager.SettingsManager` or None, optional
+
         :rtype: None
         """
         super().__init__(
@@ -41,11 +46,14 @@ class LoreOutlineManager(BaseOutlineManager):
             id_role=self.LORE_ID_ROLE,
             search_placeholder="Search Lore Entries...",
             is_nested_tree=True,
-            type=EntityType.LORE
+            type=EntityType.LORE,
+            settings_manager=settings_manager
         )
 
         bus.register_instance(self)
 
+        self._lore_icon = QIcon(":icons/lore-entry.svg")
+
         # Connect nested-specific signals not covered by base
         self.tree_widget.item_hierarchy_updated.connect(self._handle_lore_parent_update)
         self.tree_widget.item_parent_id_updated.connect(self._handle_lore_parent_update)
@@ -75,7 +83,7 @@ class LoreOutlineManager(BaseOutlineManager):
             item.setData(0, self.id_role, entry['ID'])
             item.setFlags(item.flags() | Qt.ItemFlag.ItemIsEditable 
                           | Qt.ItemFlag.ItemIsDragEnabled | Qt.ItemFlag.ItemIsDropEnabled)
-            item.setIcon(0, QIcon(":icons/lore-entry.svg"))
+            item.setIcon(0, self._lore_icon)
             item_map[entry['ID']] = item
 
         # Build Hierarchy
@@ -91,7 +99,7 @@ class LoreOutlineManager(BaseOutlineManager):
                 # Add to top level if no parent or parent not in current set (e.g. filtered search)
                 self.tree_widget.addTopLevelItem(child_item)
                 
-        self.tree_widget.expandAll()
+        self._expand_outline(restore_collapsed=not lore_data.get('search_results'))
 
     def _handle_item_renamed(self, item: QTreeWidgetItem, column: int) -> None:
         """
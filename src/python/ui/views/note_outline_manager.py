@@ -8,6 +8,7 @@ from PySide6.QtGui import QIcon
 from typing import Any
 
 from .base_outline_manager import BaseOutlineManager
+from ...services.settings_manager import SettingsManager
 from ...resources_rc import *
 from ...utils.constants import EntityType
 from ...utils.events import Events
@@ -24,7 +25,8 @@ class NoteOutlineManager(BaseOutlineManager):
     NOTE_ID_ROLE = Qt.ItemDataRole.UserRole + 1
     """The int role used to store the database ID of a Note on an item."""
 
-    def __init__(self, project_title: str = "Forgerly Project") -> None:
+    def __init__(self, project_title: str = "Forgerly Project",
+                 settings_manager: SettingsManager | None = None) -> None:
         """
         Initializes the :py:class:`.NoteOutlineManager`.
         
@@ -33,6 +35,9 @@ class NoteOutlineManager(BaseOutlineManager):
         :param coordinator: The coordinator object that coordinates to the main window.
         :type coordinator: :py:class:`.AppCoordinator` or None, optional
 
+        :param settings_manager: The settings manager used to persist collapsed items.
+        :type settings_manager: :py:class:`~app.services.settings_manager.SettingsManager` or None, optional
+
         :rtype: None
         """
 
@@ -42,11 +47,14 @@ class NoteOutlineManager(BaseOutlineManager):
             id_role=self.NOTE_ID_ROLE,
             search_placeholder="Search Notes...",
             is_nested_tree=True,
-            type=EntityType.NOTE
+            type=EntityType.NOTE,
+            settings_manager=settings_manager
         )
 
         bus.register_instance(self)
 
+        self._note_icon = QIcon(":icons/note.svg")
+
         # Connect nested-specific signals not covered by base
         self.tree_widget.item_hierarchy_updated.connect(self._handle_note_parent_update)
         self.tree_widget.item_parent_id_updated.connect(self._handle_note_parent_update)
@@ -80,7 +88,7 @@ class NoteOutlineManager(BaseOutlineManager):
             item.setData(0, self.id_role, note['ID'])
             item.setFlags(item.flags() | Qt.ItemFlag.ItemIsEditable | Qt.ItemFlag.ItemIsDragEnabled
                           | Qt.ItemFlag.ItemIsDropEnabled)
-            item.setIcon(0, QIcon(":icons/note.svg"))
+            item.setIcon(0, self._note_icon)
             item_map[note['ID']] = item
 
         # Build Hierarchy
@@ -96,7 +104,7 @@ class NoteOutlineManager(BaseOutlineManager):
                 # Add to top level if no parent or parent not in current set (e.g. filtered search)
                 self.tree_widget.addTopLevelItem(child_item)
                 
-        self.tree_widget.expandAll()
+        self._expand_outline(restore_collapsed=not data.get('search_results'))
 
     def _handle_item_renamed(self, item: QTreeWidgetItem, column: int) -> None:
         """
@@ -1,6 +1,6 @@
 # src/python/utils/event_bus.py
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, QThread, Signal
 from typing import Callable, Any
 from functools import wraps
 
@@ -62,7 +62,9 @@ class EventBus(QObject):
     """
     Centralized event bus for application-wide communication.
     
-    Simple topic-based pub/sub system using Qt signals.
+    Simple topic-based pub/sub system. Events published from the bus's own
+    thread are dispatched directly; events from other threads are marshalled
+    through a Qt signal.
     
     Usage:
         # Subscribe
@@ -134,9 +136,15 @@ class EventBus(QObject):
             if len(self._history) > self._max_history:
                 self._history.pop(0)
         
-        logger.debug(f"Event published: {topic_str}")
-        
-        # Emit via Qt signal (thread-safe)
+        logger.debug("Event published: %s", topic_str)
+
+        # Same-thread publishes are dispatched directly with a single dict lookup,
+        # skipping the Qt signal/slot metacall on hot paths (e.g. node drags).
+        if QThread.currentThread() is self.thread():
+            self._dispatch(topic_str, data)
+            return
+
+        # Emit via Qt signal so cross-thread events are queued onto the bus thread
         self.event_occurred.emit(topic_str, data)
     
     def subscribe(self, topic: str | Events, callback: Callable[[object], None]) -> None:
@@ -157,7 +165,7 @@ class EventBus(QObject):
         
         if callback not in self._subscribers[topic_str]:
             self._subscribers[topic_str].append(callback)
-            logger.debug(f"Subscribed {callback.__qualname__} to '{topic_str}'")
+            logger.debug("Subscribed %s to '%s'", callback.__qualname__, topic_str)
     
     def subscribe_once(self, topic: str | Events, callback: Callable[[object], None]) -> None:
         """
@@ -177,7 +185,7 @@ class EventBus(QObject):
         
         if callback not in self._once_subscribers[topic_str]:
             self._once_subscribers[topic_str].append(callback)
-            logger.debug(f"Subscribed (once) {callback.__qualname__} to '{topic_str}'")
+            logger.debug("Subscribed (once) %s to '%s'", callback.__qualname__, topic_str)
     
     def unsubscribe(self, topic: str | Events, callback: Callable[[object], None]) -> None:
         """
@@ -194,7 +202,7 @@ class EventBus(QObject):
         
         if topic_str in self._subscribers and callback in self._subscribers[topic_str]:
             self._subscribers[topic_str].remove(callback)
-            logger.debug(f"Unsubscribed {callback.__qualname__} from '{topic_str}'")
+            logger.debug("Unsubscribed %s from '%s'", callback.__qualname__, topic_str)
     
     def unsubscribe_all(self, topic: str | Events = None) -> None:
         """
@@ -213,7 +221,7 @@ class EventBus(QObject):
             topic_str = topic.value if isinstance(topic, Events) else topic
             self._subscribers.pop(topic_str, None)
             self._once_subscribers.pop(topic_str, None)
-            logger.debug(f"Cleared all subscriptions for '{topic_str}'")
+            logger.debug("Cleared all subscriptions for '%s'", topic_str)
 
     def register_instance(self, obj: Any) -> None:
         """
@@ -276,11 +284,8 @@ class EventBus(QObject):
                 try:
                     callback(data)
                 except Exception as e:
-                    logger.error(
-                        f"Error in subscriber {callback.__qualname__} "
-                        f"for topic '{topic}': {e}",
-                        exc_info=True
-                    )
+                    logger.error("Error in subscriber %s for topic '%s': %s",
+                                 callback.__qualname__, topic, e, exc_info=True)
         
         # One-time subscribers
         if topic in self._once_subscribers:
@@ -291,11 +296,8 @@ class EventBus(QObject):
                 try:
                     callback(data)
                 except Exception as e:
-                    logger.error(
-                        f"Error in one-time subscriber {callback.__qualname__} "
-                        f"for topic '{topic}': {e}",
-                        exc_info=True
-                    )
+                    logger.error("Error in one-time subscriber %s for topic '%s': %s",
+                                 callback.__qualname__, topic, e, exc_info=True)
     
     def get_history(self, topic: str | Events = None, limit: int = 20) -> list[tuple[str, object]]:
         """
@@ -52,6 +52,7 @@ class Events(str, Enum):
 
     # Item Deletion
     ITEM_DELETE_REQUESTED = "item.delete_requested"
+    ITEM_DELETED = "item.deleted"
     
     # Item Selection Events
     ITEM_SELECTED = "item.selected"
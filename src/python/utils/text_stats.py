@@ -6,6 +6,7 @@ from .ffi_base import ffi, lib
 ffi.cdef("""
     int calculate_word_count(const char* text);
     int calculate_character_count(const char* text, int include_spaces);
+    void calculate_text_stats(const char* text, int* word_count, int* char_count_no_spaces);
     const char* calculate_read_time(int word_count, int wpm);
 """)
 
@@ -18,6 +19,13 @@ def calculate_character_count(text: str, include_spaces: bool = True) -> int:
     c_include_spaces = 1 if include_spaces else 0
     return lib.calculate_character_count(text_bytes, c_include_spaces)
 
+def calculate_text_stats(text: str) -> tuple[int, int]:
+    text_bytes = text.encode('utf-8')
+    word_count = ffi.new("int*")
+    char_count = ffi.new("int*")
+    lib.calculate_text_stats(text_bytes, word_count, char_count)
+    return word_count[0], char_count[0]
+
 def calculate_read_time(word_count: int, wpm: int = 250) -> str:
     result_ptr = lib.calculate_read_time(word_count, wpm)
     if result_ptr:
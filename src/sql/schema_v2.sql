@@ -87,6 +87,9 @@ CREATE TABLE IF NOT EXISTS Tags (
     Name                    TEXT NOT NULL UNIQUE
 );
 
+-- Pure two-column link tables are stored WITHOUT ROWID, so each row lives only in the
+-- primary key B-tree instead of a rowid table plus a separate primary key index.
+
 -- CHAPTER_TAGS: Many-to-many relationship between Chapters and Tags.
 CREATE TABLE IF NOT EXISTS Chapter_Tags (
     Chapter_ID              INTEGER NOT NULL,
@@ -95,7 +98,7 @@ CREATE TABLE IF NOT EXISTS Chapter_Tags (
     PRIMARY KEY (Chapter_ID, Tag_ID),
     FOREIGN KEY (Chapter_ID) REFERENCES Chapters(ID) ON DELETE CASCADE,
     FOREIGN KEY (Tag_ID) REFERENCES Tags(ID) ON DELETE CASCADE
-);
+) WITHOUT ROWID;
 
 -- LORE_TAGS: Many-to-many relationship between Lore_Entries and Tags.
 CREATE TABLE IF NOT EXISTS Lore_Tags (
@@ -105,7 +108,7 @@ CREATE TABLE IF NOT EXISTS Lore_Tags (
     PRIMARY KEY (Lore_ID, Tag_ID),
     FOREIGN KEY (Lore_ID) REFERENCES Lore_Entries(ID) ON DELETE CASCADE,
     FOREIGN KEY (Tag_ID) REFERENCES Tags(ID) ON DELETE CASCADE
-);
+) WITHOUT ROWID;
 
 -- NOTE_TAGS: Many-to-many relationship between Notes and Tags.
 CREATE TABLE IF NOT EXISTS Note_Tags (
@@ -115,7 +118,7 @@ CREATE TABLE IF NOT EXISTS Note_Tags (
     PRIMARY KEY (Note_ID, Tag_ID),
     FOREIGN KEY (Note_ID) REFERENCES Notes(ID) ON DELETE CASCADE,
     FOREIGN KEY (Tag_ID) REFERENCES Tags(ID) ON DELETE CASCADE
-);
+) WITHOUT ROWID;
 
 -- CHAPTER_CHARACTERS: Many-to-many relationship tracking character appearances in chapters.
 CREATE TABLE IF NOT EXISTS Chapter_Characters (
@@ -136,7 +139,7 @@ CREATE TABLE IF NOT EXISTS Chapter_Lore (
     PRIMARY KEY (Chapter_ID, Lore_ID),
     FOREIGN KEY (Chapter_ID) REFERENCES Chapters(ID) ON DELETE CASCADE,
     FOREIGN KEY (Lore_ID) REFERENCES Lore_Entries(ID) ON DELETE CASCADE
-);
+) WITHOUT ROWID;
 
 -- CHARACTER_LORE: Explicitly links characters to the lore entries they reference.
 CREATE TABLE IF NOT EXISTS Character_Lore (
@@ -146,7 +149,7 @@ CREATE TABLE IF NOT EXISTS Character_Lore (
     PRIMARY KEY (Character_ID, Lore_ID),
     FOREIGN KEY (Character_ID) REFERENCES Characters(ID) ON DELETE CASCADE,
     FOREIGN KEY (Lore_ID) REFERENCES Lore_Entries(ID) ON DELETE CASCADE
-);
+) WITHOUT ROWID;
 
 -- CHAPTER_LOCATIONS: Links chapters to the locations where the scene takes place.
 CREATE TABLE IF NOT EXISTS Chapter_Locations (
@@ -167,7 +170,7 @@ CREATE TABLE IF NOT EXISTS Lore_Locations (
     PRIMARY KEY (Lore_ID, Location_ID),
     FOREIGN KEY (Lore_ID) REFERENCES Lore_Entries(ID) ON DELETE CASCADE,
     FOREIGN KEY (Location_ID) REFERENCES Locations(ID) ON DELETE CASCADE
-);
+) WITHOUT ROWID;
 
 -- CHARACTER_LOCATIONS: Links characters to significant locations.
 CREATE TABLE IF NOT EXISTS Character_Locations (
@@ -272,7 +275,56 @@ CREATE TABLE IF NOT EXISTS Junction_Connections (
 );
 
 -- -----------------------------------------------------------------------------
--- 5. Indexes (Performance)
+-- 5. Full-Text Search Indexes
+-- -----------------------------------------------------------------------------
+
+-- External-content FTS5 indexes kept in sync with their tables by triggers. They are
+-- populated from existing rows by DBConnector.initialize_schema when first created.
+-- The trigram tokenizer indexes every three-character sequence, so a quoted query
+-- matches anywhere inside a value, as the LIKE '%...%' searches they replace did.
+
+-- Characters search (Name, Status)
+CREATE VIRTUAL TABLE IF NOT EXISTS Characters_FTS USING fts5(
+    Name, Status, content='Characters', content_rowid='ID', tokenize='trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_characters_fts_insert AFTER INSERT ON Characters BEGIN
+    INSERT INTO Characters_FTS (rowid, Name, Status) VALUES (new.ID, new.Name, new.Status);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_characters_fts_delete AFTER DELETE ON Characters BEGIN
+    INSERT INTO Characters_FTS (Characters_FTS, rowid, Name, Status) 
+    VALUES ('delete', old.ID, old.Name, old.Status);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_characters_fts_update AFTER UPDATE OF Name, Status ON Characters BEGIN
+    INSERT INTO Characters_FTS (Characters_FTS, rowid, Name, Status) 
+    VALUES ('delete', old.ID, old.Name, old.Status);
+    INSERT INTO Characters_FTS (rowid, Name, Status) VALUES (new.ID, new.Name, new.Status);
+END;
+
+-- Lore search (Title, Category)
+CREATE VIRTUAL TABLE IF NOT EXISTS Lore_Entries_FTS USING fts5(
+    Title, Category, content='Lore_Entries', content_rowid='ID', tokenize='trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_lore_entries_fts_insert AFTER INSERT ON Lore_Entries BEGIN
+    INSERT INTO Lore_Entries_FTS (rowid, Title, Category) VALUES (new.ID, new.Title, new.Category);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_lore_entries_fts_delete AFTER DELETE ON Lore_Entries BEGIN
+    INSERT INTO Lore_Entries_FTS (Lore_Entries_FTS, rowid, Title, Category) 
+    VALUES ('delete', old.ID, old.Title, old.Category);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_lore_entries_fts_update AFTER UPDATE OF Title, Category ON Lore_Entries BEGIN
+    INSERT INTO Lore_Entries_FTS (Lore_Entries_FTS, rowid, Title, Category) 
+    VALUES ('delete', old.ID, old.Title, old.Category);
+    INSERT INTO Lore_Entries_FTS (rowid, Title, Category) VALUES (new.ID, new.Title, new.Category);
+END;
+
+-- -----------------------------------------------------------------------------
+-- 6. Indexes (Performance)
 -- -----------------------------------------------------------------------------
 
 -- Indexes to improve lookup performance on foreign keys
@@ -291,6 +343,7 @@ CREATE INDEX IF NOT EXISTS idx_lore_tags_tag ON Lore_Tags (Tag_ID);
 CREATE INDEX IF NOT EXISTS idx_lore_locations_location on LORE_Locations (Location_ID);
 CREATE INDEX IF NOT EXISTS vix_lore_title ON Lore_Entries(Title);
 CREATE INDEX IF NOT EXISTS idx_lore_category ON Lore_Entries (Category);
+CREATE INDEX IF NOT EXISTS idx_lore_parent ON Lore_Entries (Parent_Lore_ID, Sort_Order, Title);
 CREATE INDEX IF NOT EXISTS idx_notes_parent ON Notes (Parent_Note_ID);
 CREATE INDEX IF NOT EXISTS idx_note_tags_tag ON Note_Tags (Tag_ID);
 
@@ -303,6 +356,13 @@ CREATE INDEX IF NOT EXISTS idx_char_locations_loc ON Character_Locations (Locati
 -- Index for quick look up of Chapters by Title (e.g., for search/autocomplete)
 CREATE INDEX IF NOT EXISTS idx_chapters_title ON Chapters (Title);
 
+-- Covering indexes for the outline queries, which read the rows already in display order
+-- (the ID rowid is stored in every index, so it doesn't need to be listed)
+CREATE INDEX IF NOT EXISTS idx_chapters_sort ON Chapters (Sort_Order, Title);
+CREATE INDEX IF NOT EXISTS idx_characters_name ON Characters (Name, Status);
+CREATE INDEX IF NOT EXISTS idx_lore_outline ON Lore_Entries (Sort_Order, Title, Category, Parent_Lore_ID);
+CREATE INDEX IF NOT EXISTS idx_notes_outline ON Notes (Sort_Order, Title, Parent_Note_ID);
+
 -- Junction indexes
 CREATE INDEX IF NOT EXISTS idx_junction_connections_junction ON Junction_Connections (Junction_ID);
 CREATE INDEX IF NOT EXISTS idx_junction_connections_character ON Junction_Connections (Character_ID);
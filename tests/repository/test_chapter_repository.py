@@ -2,6 +2,7 @@
 
 import pytest
 from src.python.repository.chapter_repository import ChapterRepository
+from src.python.utils.text_stats import calculate_word_count, calculate_character_count
 from src.python.db_connector import DBConnector # Used for type hinting, though injected by fixture
 
 # The initialized_connector fixture provides a connected, schema-initialized DBConnector
@@ -42,6 +43,20 @@ def test_update_chapter_title(chapter_repo: ChapterRepository):
     assert success is True
     assert chapter_repo.get_chapter_title(chapter_id) == new_title
 
+def test_get_chapter_title_after_updates(chapter_repo: ChapterRepository):
+    """Tests that a previously fetched title reflects later updates and deletion."""
+    chapter_id = chapter_repo.create_chapter("First Title", 1)
+    assert chapter_repo.get_chapter_title(chapter_id) == "First Title"
+
+    chapter_repo.update_chapter_title(chapter_id, "Second Title")
+    assert chapter_repo.get_chapter_title(chapter_id) == "Second Title"
+
+    chapter_repo.update_chapter_content(chapter_id, "Third Title", "<p>Text</p>")
+    assert chapter_repo.get_chapter_title(chapter_id) == "Third Title"
+
+    chapter_repo.delete_chapter(chapter_id)
+    assert chapter_repo.get_chapter_title(chapter_id) is None
+
 def test_create_and_update_content(chapter_repo: ChapterRepository):
     """Tests creating a chapter and updating its text content."""
     chapter_id = chapter_repo.create_chapter("Draft Chapter", 2)
@@ -61,6 +76,18 @@ def test_create_and_update_content(chapter_repo: ChapterRepository):
     assert retrieved_data.get('Title') == new_title
     assert retrieved_data.get('Text_Content') == new_content
 
+def test_update_chapter_content_unchanged(chapter_repo: ChapterRepository):
+    """Tests that saving unchanged content succeeds without modifying the row."""
+    chapter_id = chapter_repo.create_chapter("Same Title", 1, text_content="<p>Same</p>")
+    changes_before = chapter_repo.db.conn.total_changes
+
+    # Act
+    success = chapter_repo.update_chapter_content(chapter_id, "Same Title", "<p>Same</p>")
+
+    # Assert
+    assert success is True
+    assert chapter_repo.db.conn.total_changes == changes_before
+
 def test_get_all_chapters_ordering_and_fields(chapter_repo: ChapterRepository):
     """Tests retrieval of all chapters (basic info) and correct ordering."""
     # Setup multiple chapters in random insertion order but defined Sort_Order
@@ -86,13 +113,44 @@ def test_get_all_chapters_with_content(chapter_repo: ChapterRepository):
     chapter_repo.create_chapter("Full Test", 1)
     
     # Act
-    chapters = chapter_repo._get_all_chapters_with_content()
+    chapters = list(chapter_repo._get_all_chapters_with_content())
     
     # Assert
     assert len(chapters) == 1
-    # Check that the Text_Content field is present
-    assert 'Text_Content' in chapters[0]
-    assert chapters[0]['Text_Content'] == "<p></p>" # Default content
+    # Rows are (ID, Title, Text_Content, Sort_Order) tuples
+    chapter_id, title, text_content, sort_order = chapters[0]
+    assert title == "Full Test"
+    assert text_content == "<p></p>" # Default content
+
+def test_get_all_chapters_stats(chapter_repo: ChapterRepository):
+    """Tests that chapter statistics are calculated in Sort_Order."""
+    chapter_repo.create_chapter("Second", 2, text_content="<p>Three more words</p>")
+    chapter_repo.create_chapter("First", 1, text_content="<p>Hello world</p>")
+
+    # Act
+    stats = chapter_repo.get_all_chapters_stats()
+
+    # Assert
+    assert stats == [
+        {'word_count': calculate_word_count("<p>Hello world</p>"),
+         'char_count_no_spaces': calculate_character_count("<p>Hello world</p>", include_spaces=False)},
+        {'word_count': calculate_word_count("<p>Three more words</p>"),
+         'char_count_no_spaces': calculate_character_count("<p>Three more words</p>", include_spaces=False)},
+    ]
+    assert stats[1]['word_count'] == 3
+
+def test_get_chapters_bulk(chapter_repo: ChapterRepository):
+    """Tests retrieving the content of several chapters in one call."""
+    c1_id = chapter_repo.create_chapter("Chapter One", 1, text_content="<p>One</p>")
+    c2_id = chapter_repo.create_chapter("Chapter Two", 2, text_content="<p>Two</p>")
+    chapter_repo.create_chapter("Chapter Three", 3)
+
+    # Act: Include an ID that doesn't exist
+    contents = chapter_repo.get_chapters_bulk([c2_id, c1_id, 9999])
+
+    # Assert
+    assert contents == {c1_id: "<p>One</p>", c2_id: "<p>Two</p>"}
+    assert chapter_repo.get_chapters_bulk([]) == {}
 
 def test_delete_chapter(chapter_repo: ChapterRepository):
     """Tests deletion of a chapter."""
@@ -100,6 +158,7 @@ def test_delete_chapter(chapter_repo: ChapterRepository):
     
     # 1. Verify existence
     assert chapter_repo.get_chapter_title(chapter_id) is not None
+    assert chapter_repo.chapter_exists(chapter_id) is True
     
     # 2. Act: Delete
     success = chapter_repo.delete_chapter(chapter_id)
@@ -107,6 +166,7 @@ def test_delete_chapter(chapter_repo: ChapterRepository):
     # 3. Verify deletion
     assert success is True
     assert chapter_repo.get_chapter_title(chapter_id) is None
+    assert chapter_repo.chapter_exists(chapter_id) is False
 
 def test_get_all_chapters_for_export_all(chapter_repo: ChapterRepository):
     """
@@ -155,6 +215,34 @@ def test_get_all_chapters_for_export_filtered(chapter_repo: ChapterRepository):
     # Ensure Chapter Gamma (c3_id) was excluded
     assert c3_id not in [c['ID'] for c in chapters]
 
+def test_get_all_chapters_for_export_many_ids(chapter_repo: ChapterRepository):
+    """Tests export filtering with duplicate IDs and more IDs than SQLite's parameter limit."""
+    chapter_ids = [chapter_repo.create_chapter(f"Chapter {i}", i + 1) for i in range(1200)]
+
+    # Act: Request every chapter twice
+    chapters = chapter_repo.get_all_chapters_for_export(chapter_ids=chapter_ids + chapter_ids)
+
+    # Assert: Each chapter is returned once, in Sort_Order
+    assert [c['ID'] for c in chapters] == chapter_ids
+
+def test_get_all_chapters_for_export_with_pov(chapter_repo: ChapterRepository):
+    """Tests that export rows include the POV character's name from a single join."""
+    char_id = chapter_repo.db._execute_commit(
+        "INSERT INTO Characters (Name) VALUES (?);", ("Elizabeth Bennet",), fetch_id=True
+    )
+    c1_id = chapter_repo.create_chapter("With POV", 1, pov_character_id=char_id)
+    c2_id = chapter_repo.create_chapter("Without POV", 2)
+
+    # Act
+    chapters = chapter_repo.get_all_chapters_for_export_with_pov()
+
+    # Assert
+    assert [(c['ID'], c['POV_Name']) for c in chapters] == [(c1_id, "Elizabeth Bennet"), (c2_id, None)]
+    assert chapters[0]['Text_Content'] == "<p></p>"
+
+    # Filtering by ID still applies
+    assert [c['ID'] for c in chapter_repo.get_all_chapters_for_export_with_pov([c2_id])] == [c2_id]
+
 # --- Test for reorder_chapters ---
 
 def test_reorder_chapters_success(chapter_repo: ChapterRepository):
@@ -193,3 +281,17 @@ def test_reorder_chapters_success(chapter_repo: ChapterRepository):
     assert reordered_chapters[1]['Sort_Order'] == 2
     assert reordered_chapters[2]['ID'] == c2_id
     assert reordered_chapters[2]['Sort_Order'] == 3
+
+
+def test_reorder_chapters_large_batch(chapter_repo: ChapterRepository):
+    """Tests reordering a large outline in one call."""
+    chapter_ids = [chapter_repo.create_chapter(f"Chapter {i}", i + 1) for i in range(650)]
+
+    # Reverse the order of every chapter
+    reorder_operations = [(chapter_id, i + 1) for i, chapter_id in enumerate(reversed(chapter_ids))]
+
+    assert chapter_repo.reorder_chapters(reorder_operations) is True
+
+    reordered_chapters = chapter_repo.get_all_chapters()
+    assert [c['ID'] for c in reordered_chapters] == list(reversed(chapter_ids))
+    assert [c['Sort_Order'] for c in reordered_chapters] == list(range(1, 651))
@@ -3,6 +3,7 @@
 import pytest
 from src.python.repository.character_repository import CharacterRepository
 from src.python.db_connector import DBConnector 
+from src.python.utils.exceptions import DatabaseError
 
 @pytest.fixture
 def char_repo(initialized_connector: DBConnector) -> CharacterRepository:
@@ -84,6 +85,50 @@ def test_get_character_name(char_repo: CharacterRepository):
     # Test non-existent ID
     assert char_repo.get_character_name(9999) is None
 
+def test_get_character_name_after_rename_and_delete(char_repo: CharacterRepository):
+    """Tests that a previously fetched name reflects later renames and deletion."""
+    char_id = create_test_character(char_repo, "Bilbo")
+    assert char_repo.get_character_name(char_id) == "Bilbo"
+
+    char_repo.update_character_name(char_id, "Frodo")
+    assert char_repo.get_character_name(char_id) == "Frodo"
+
+    char_repo.update_character(char_id, "Samwise")
+    assert char_repo.get_character_name(char_id) == "Samwise"
+
+    char_repo.delete_character(char_id)
+    assert char_repo.get_character_name(char_id) is None
+
+def test_get_character_details_after_update_and_delete(char_repo: CharacterRepository):
+    """Tests that previously fetched details reflect later updates and deletion."""
+    char_id = create_test_character(char_repo, "Bilbo")
+    details = char_repo.get_character_details(char_id)
+    details['Name'] = "Edited by caller"
+    assert char_repo.get_character_details(char_id)['Name'] == "Bilbo"
+
+    char_repo.update_character(char_id, "Bilbo", status="Retired")
+    assert char_repo.get_character_details(char_id)['Status'] == "Retired"
+
+    char_repo.update_character_name(char_id, "Frodo")
+    assert char_repo.get_character_details(char_id)['Name'] == "Frodo"
+
+    char_repo.delete_character(char_id)
+    assert char_repo.get_character_details(char_id) is None
+
+def test_character_details_cache_is_bounded(char_repo: CharacterRepository, monkeypatch):
+    """Tests that the least recently used details are dropped once the cache is full."""
+    monkeypatch.setattr("src.python.repository.character_repository._DETAILS_CACHE_SIZE", 2)
+    a_id = create_test_character(char_repo, "Alice")
+    b_id = create_test_character(char_repo, "Bob")
+    c_id = create_test_character(char_repo, "Carol")
+
+    char_repo.get_character_details(a_id)
+    char_repo.get_character_details(b_id)
+    char_repo.get_character_details(a_id)
+    char_repo.get_character_details(c_id)
+
+    assert list(char_repo._details_cache) == [a_id, c_id]
+
 def test_search_characters_by_name_and_status(char_repo: CharacterRepository):
     """Tests the character search functionality using LIKE patterns."""
     create_test_character(char_repo, "Commander Shepard", "N7")
@@ -98,3 +143,115 @@ def test_search_characters_by_name_and_status(char_repo: CharacterRepository):
     results = char_repo.search_characters("Archangel")
     assert len(results) == 1 
     assert results[0]['Name'] == "Garrus Vakarian"
+
+def test_search_characters_after_rename_and_delete(char_repo: CharacterRepository):
+    """Tests that the full-text search index follows character updates and deletions."""
+    char_id = create_test_character(char_repo, "Commander Shepard", "N7")
+
+    char_repo.update_character_name(char_id, "Admiral Anderson")
+    assert char_repo.search_characters("shep") == []
+    assert [c['ID'] for c in char_repo.search_characters("ander")] == [char_id]
+
+    char_repo.delete_character(char_id)
+    assert char_repo.search_characters("ander") == []
+
+def test_search_characters_punctuation_only(char_repo: CharacterRepository):
+    """Tests that queries without words are matched literally rather than as wildcards."""
+    create_test_character(char_repo, "R2-D2", "Droid")
+    create_test_character(char_repo, "Obi-Wan", "100% Jedi")
+
+    assert [c['Name'] for c in char_repo.search_characters("-")] == ["Obi-Wan", "R2-D2"]
+    assert [c['Name'] for c in char_repo.search_characters("%")] == ["Obi-Wan"]
+
+def test_search_index_built_for_existing_characters(initialized_connector: DBConnector):
+    """Tests that a newly created search index is filled from existing characters."""
+    # Simulate a project created before the search index existed
+    initialized_connector.conn.executescript("""
+        DROP TRIGGER trg_characters_fts_insert;
+        DROP TABLE Characters_FTS;
+        INSERT INTO Characters (Name, Status) VALUES ('Garrus Vakarian', 'Archangel');
+    """)
+
+    initialized_connector.initialize_schema()
+
+    results = CharacterRepository(initialized_connector).search_characters("garrus")
+    assert [c['Name'] for c in results] == ["Garrus Vakarian"]
+
+def test_get_all_characters_for_export_filtered(char_repo: CharacterRepository):
+    """Tests exporting a subset of characters by ID, ordered by Name."""
+    zoe_id = create_test_character(char_repo, "Zoe")
+    alice_id = create_test_character(char_repo, "Alice")
+    create_test_character(char_repo, "Bob")
+
+    results = char_repo.get_all_characters_for_export([zoe_id, alice_id, zoe_id])
+
+    assert [c['ID'] for c in results] == [alice_id, zoe_id]
+    assert len(char_repo.get_all_characters_for_export()) == 3
+
+def test_iter_characters_for_export_streams_rows(char_repo: CharacterRepository):
+    """Tests that the export iterator yields the same rows lazily."""
+    create_test_character(char_repo, "Zoe")
+    create_test_character(char_repo, "Alice")
+
+    rows = char_repo.iter_characters_for_export()
+
+    assert next(rows)['Name'] == "Alice"
+    assert [c['Name'] for c in rows] == ["Zoe"]
+
+def test_get_number_of_characters(char_repo: CharacterRepository):
+    """Tests that the character count follows creates and deletes."""
+    assert char_repo.get_number_of_characters() == 0
+
+    char_id = create_test_character(char_repo, "Alice")
+    create_test_character(char_repo, "Bob")
+    assert char_repo.get_number_of_characters() == 2
+
+    char_repo.delete_character(char_id)
+    assert char_repo.get_number_of_characters() == 1
+
+def test_create_characters_bulk(char_repo: CharacterRepository):
+    """Tests inserting several characters in one transaction."""
+    char_ids = char_repo.create_characters_bulk([
+        ("Zoe", "Pilot", "Alive"),
+        ("Alice", "", "Deceased"),
+    ])
+
+    assert [char_repo.get_character_name(char_id) for char_id in char_ids] == ["Zoe", "Alice"]
+    assert [c['Name'] for c in char_repo.get_all_characters()] == ["Alice", "Zoe"]
+    assert [c['Name'] for c in char_repo.search_characters("deceased")] == ["Alice"]
+
+def test_create_characters_bulk_rollback(char_repo: CharacterRepository):
+    """Tests that a failing row rolls back the whole batch and raises."""
+    create_test_character(char_repo, "Alice")
+
+    # Name is NOT NULL, so the second row rolls back the whole batch
+    with pytest.raises(DatabaseError):
+        char_repo.create_characters_bulk([("Zoe", "", "Alive"), (None, "", "Alive")])
+    assert char_repo.get_number_of_characters() == 1
+
+def test_get_all_character_names(char_repo: CharacterRepository):
+    """Tests that character names are returned as plain strings."""
+    create_test_character(char_repo, "Alice")
+    create_test_character(char_repo, "Bob")
+
+    assert sorted(char_repo.get_all_character_names()) == ["Alice", "Bob"]
+
+def test_get_all_characters_for_export_columns(char_repo: CharacterRepository):
+    """Tests exporting only selected columns and rejecting unknown ones."""
+    alice_id = create_test_character(char_repo, "Alice")
+
+    results = char_repo.get_all_characters_for_export(columns=('ID', 'Name'))
+    assert results == [{'ID': alice_id, 'Name': "Alice"}]
+
+    with pytest.raises(ValueError):
+        char_repo.get_all_characters_for_export(columns=('Name', 'Name FROM Characters; --'))
+
+def test_search_characters_mid_word(char_repo: CharacterRepository):
+    """Tests that queries match inside words, including queries shorter than a trigram."""
+    create_test_character(char_repo, "Alice", "Queen of Hearts")
+    create_test_character(char_repo, "Bob", "Alive")
+
+    assert [c['Name'] for c in char_repo.search_characters("ice")] == ["Alice"]
+    assert [c['Name'] for c in char_repo.search_characters("of hear")] == ["Alice"]
+    assert [c['Name'] for c in char_repo.search_characters("li")] == ["Alice", "Bob"]
+    assert char_repo.search_characters('"ice') == []
@@ -3,6 +3,7 @@
 import pytest
 from src.python.repository.lore_repository import LoreRepository
 from src.python.db_connector import DBConnector 
+from src.python.utils.exceptions import DatabaseError
 from src.python.repository.tag_repository import TagRepository # Needed to set up tags for search
 
 @pytest.fixture
@@ -68,6 +69,18 @@ def test_update_lore_entry(lore_repo: LoreRepository):
     assert details['Content'] == new_content
     assert details['Category'] == new_category
 
+def test_update_lore_entry_unchanged(lore_repo: LoreRepository):
+    """Tests that saving an unchanged entry succeeds without modifying the row."""
+    lore_id = create_test_lore(lore_repo, "Same Title", "Same Cat", "<p>Same</p>")
+    changes_before = lore_repo.db.conn.total_changes
+
+    # Act
+    success = lore_repo.update_lore_entry(lore_id, "Same Title", "<p>Same</p>", "Same Cat")
+
+    # Assert
+    assert success is True
+    assert lore_repo.db.conn.total_changes == changes_before
+
 def test_delete_lore_entry(lore_repo: LoreRepository):
     """Tests successful deletion of a lore entry."""
     lore_id = create_test_lore(lore_repo, "Entry to Delete")
@@ -104,3 +117,208 @@ def test_search_lore_entries_by_title_category_and_tag(lore_repo: LoreRepository
     results = lore_repo.search_lore_entries("conflict")
     assert len(results) == 1
     assert results[0]['Title'] == "The Great War"
+
+def test_search_lore_entries_after_update_and_delete(lore_repo: LoreRepository):
+    """Tests that the search index follows title changes and deletion."""
+    lore_id = create_test_lore(lore_repo, "The Blue Staff", category="Item")
+
+    lore_repo.update_lore_entry_title(lore_id, "The Red Staff")
+    assert lore_repo.search_lore_entries("blue") == []
+    assert [r['ID'] for r in lore_repo.search_lore_entries("red")] == [lore_id]
+
+    lore_repo.delete_lore_entry(lore_id)
+    assert lore_repo.search_lore_entries("red") == []
+
+def test_search_lore_entries_matches_once_with_many_tags(lore_repo: LoreRepository, tag_repo: TagRepository):
+    """Tests that an entry matching on several tags and its title is returned once."""
+    lore_id = create_test_lore(lore_repo, "Dragon Lore", category="Creature")
+    tag_repo.set_tags_for_lore_entry(lore_id, ['dragons', 'dragonfire'])
+
+    assert [r['ID'] for r in lore_repo.search_lore_entries("dragon")] == [lore_id]
+
+def test_search_lore_entries_punctuation_only(lore_repo: LoreRepository):
+    """Tests that queries without words are matched literally rather than as wildcards."""
+    create_test_lore(lore_repo, "Half-Elves", category="Race")
+    create_test_lore(lore_repo, "Elves", category="Race")
+
+    assert [r['Title'] for r in lore_repo.search_lore_entries("-")] == ["Half-Elves"]
+
+def test_search_lore_entries_mid_word(lore_repo: LoreRepository):
+    """Tests that queries match inside words, including queries shorter than a trigram."""
+    create_test_lore(lore_repo, "Dragonstone", category="Location")
+    create_test_lore(lore_repo, "Moonstone", category="Artifact")
+
+    assert [r['Title'] for r in lore_repo.search_lore_entries("stone")] == ["Dragonstone", "Moonstone"]
+    assert [r['Title'] for r in lore_repo.search_lore_entries("ifac")] == ["Moonstone"]
+    assert [r['Title'] for r in lore_repo.search_lore_entries("on")] == ["Dragonstone", "Moonstone"]
+
+def test_search_index_built_for_existing_lore_entries(initialized_connector: DBConnector):
+    """Tests that a newly created search index is filled from existing lore entries."""
+    # Simulate a project created before the search index existed
+    initialized_connector.conn.executescript("""
+        DROP TRIGGER trg_lore_entries_fts_insert;
+        DROP TABLE Lore_Entries_FTS;
+        INSERT INTO Lore_Entries (Title, Category) VALUES ('The Citadel', 'Location');
+    """)
+
+    initialized_connector.initialize_schema()
+
+    results = LoreRepository(initialized_connector).search_lore_entries("citadel")
+    assert [r['Title'] for r in results] == ["The Citadel"]
+
+def test_get_all_lore_entry_titles(lore_repo: LoreRepository):
+    """Tests that lore entry titles are returned as plain strings."""
+    create_test_lore(lore_repo, "The Citadel")
+    create_test_lore(lore_repo, "Ancient Ruins")
+
+    assert sorted(lore_repo.get_all_lore_entry_titles()) == ["Ancient Ruins", "The Citadel"]
+
+def test_get_number_of_lore_entries(lore_repo: LoreRepository):
+    """Tests that the lore entry count follows creates and deletes."""
+    assert lore_repo.get_number_of_lore_entries() == 0
+
+    lore_id = create_test_lore(lore_repo, "The Citadel")
+    create_test_lore(lore_repo, "Ancient Ruins")
+    assert lore_repo.get_number_of_lore_entries() == 2
+
+    lore_repo.delete_lore_entry(lore_id)
+    assert lore_repo.get_number_of_lore_entries() == 1
+
+def test_get_lore_entries_for_export_filtered(lore_repo: LoreRepository):
+    """Tests exporting a subset of lore entries by ID, ordered by Title."""
+    zeta_id = create_test_lore(lore_repo, "Zeta")
+    alpha_id = create_test_lore(lore_repo, "Alpha")
+    create_test_lore(lore_repo, "Beta")
+
+    results = lore_repo.get_lore_entries_for_export([zeta_id, alpha_id, zeta_id] + list(range(1000, 2200)))
+
+    assert [r['ID'] for r in results] == [alpha_id, zeta_id]
+    assert len(lore_repo.get_lore_entries_for_export()) == 3
+
+def test_get_unique_categories_after_changes(lore_repo: LoreRepository):
+    """Tests that previously fetched categories reflect later creates, updates and deletes."""
+    lore_id = create_test_lore(lore_repo, "The Citadel", category="Location")
+    assert lore_repo.get_unique_categories() == ["Location"]
+
+    create_test_lore(lore_repo, "The Shattering", category="History")
+    assert lore_repo.get_unique_categories() == ["History", "Location"]
+
+    lore_repo.update_lore_entry(lore_id, "The Citadel", category="Faction")
+    assert lore_repo.get_unique_categories() == ["Faction", "History"]
+
+    lore_repo.delete_lore_entry(lore_id)
+    assert lore_repo.get_unique_categories() == ["History"]
+
+def test_reorder_lore_entries(lore_repo: LoreRepository):
+    """Tests reordering several lore entries in one transaction."""
+    a_id = create_test_lore(lore_repo, "A Stone")
+    b_id = create_test_lore(lore_repo, "B River")
+    c_id = create_test_lore(lore_repo, "C City")
+
+    success = lore_repo.reorder_lore_entries([(c_id, 1), (a_id, 2), (b_id, 3)])
+
+    assert success is True
+    entries = lore_repo.get_all_lore_entries()
+    assert [e['ID'] for e in entries] == [c_id, a_id, b_id]
+    assert [e['Sort_Order'] for e in entries] == [1, 2, 3]
+
+def test_iter_lore_entries_for_export_streams_rows(lore_repo: LoreRepository):
+    """Tests that the export iterator yields the same rows lazily."""
+    create_test_lore(lore_repo, "Zeta", content="<p>Last</p>")
+    create_test_lore(lore_repo, "Alpha", content="<p>First</p>")
+
+    rows = lore_repo.iter_lore_entries_for_export()
+
+    assert next(rows)['Content'] == "<p>First</p>"
+    assert [r['Title'] for r in rows] == ["Zeta"]
+
+def test_get_content_by_title(lore_repo: LoreRepository):
+    """Tests the case-insensitive substring lookup used for highlighted text."""
+    lore_id = create_test_lore(lore_repo, "The Crystal Caves", content="Deep and dark.")
+    create_test_lore(lore_repo, "The Blue Staff")
+
+    results = lore_repo.get_content_by_title("  crystal ")
+
+    assert [(r['ID'], r['Content']) for r in results] == [(lore_id, "Deep and dark.")]
+
+def test_get_lore_entry_children(lore_repo: LoreRepository):
+    """Tests retrieving root entries and the children of an entry, in outline order."""
+    parent_id = lore_repo.create_lore_entry("Kingdoms")
+    second_id = lore_repo.create_lore_entry("Southern Kingdom", parent_lore_id=parent_id, sort_order=2)
+    first_id = lore_repo.create_lore_entry("Northern Kingdom", parent_lore_id=parent_id, sort_order=1)
+
+    assert [e['ID'] for e in lore_repo.get_lore_entry_children(parent_id)] == [first_id, second_id]
+    assert [e['ID'] for e in lore_repo.get_lore_entry_children(None)] == [parent_id]
+
+def test_get_lore_entry_details_after_changes(lore_repo: LoreRepository):
+    """Tests that previously fetched details and titles reflect later updates and deletes."""
+    parent_id = lore_repo.create_lore_entry("Kingdoms")
+    child_id = lore_repo.create_lore_entry("Northern Kingdom", parent_lore_id=parent_id)
+
+    details = lore_repo.get_lore_entry_details(parent_id)
+    details['Title'] = "Edited by caller"
+    assert lore_repo.get_lore_entry_title(parent_id) == "Kingdoms"
+
+    lore_repo.update_lore_entry_title(parent_id, "Realms")
+    assert lore_repo.get_lore_entry_details(parent_id)['Title'] == "Realms"
+
+    lore_repo.update_lore_entry(parent_id, "Realms", "<p>All realms</p>", "Location")
+    assert lore_repo.get_lore_entry_details(parent_id)['Content'] == "<p>All realms</p>"
+
+    # Deleting the parent cascades to the cached child
+    assert lore_repo.get_lore_entry_details(child_id) is not None
+    lore_repo.delete_lore_entry(parent_id)
+    assert lore_repo.get_lore_entry_details(child_id) is None
+    assert lore_repo.get_lore_entry_title(parent_id) is None
+
+def test_lore_details_cache_is_bounded(lore_repo: LoreRepository, monkeypatch):
+    """Tests that the least recently used details are dropped once the cache is full."""
+    monkeypatch.setattr("src.python.repository.lore_repository._DETAILS_CACHE_SIZE", 2)
+    a_id = create_test_lore(lore_repo, "A Stone")
+    b_id = create_test_lore(lore_repo, "B River")
+    c_id = create_test_lore(lore_repo, "C City")
+
+    lore_repo.get_lore_entry_details(a_id)
+    lore_repo.get_lore_entry_details(b_id)
+    lore_repo.get_lore_entry_details(a_id)
+    lore_repo.get_lore_entry_details(c_id)
+
+    assert list(lore_repo._details_cache) == [a_id, c_id]
+
+def test_search_lore_entries_punctuation_matches_tags(lore_repo: LoreRepository, tag_repo: TagRepository):
+    """Tests that the literal fallback search also matches tag names."""
+    lore_id = create_test_lore(lore_repo, "The Great War", category="History")
+    tag_repo.set_tags_for_lore_entry(lore_id, ['pre-war'])
+
+    assert [r['ID'] for r in lore_repo.search_lore_entries("-")] == [lore_id]
+
+def test_get_lore_entry_titles_bulk(lore_repo: LoreRepository):
+    """Tests retrieving the titles of several lore entries in one call."""
+    a_id = create_test_lore(lore_repo, "A Stone")
+    b_id = create_test_lore(lore_repo, "B River")
+    create_test_lore(lore_repo, "C City")
+
+    # Act: Include an ID that doesn't exist
+    titles = lore_repo.get_lore_entry_titles_bulk([b_id, a_id, 9999])
+
+    # Assert
+    assert titles == {a_id: "A Stone", b_id: "B River"}
+    assert lore_repo.get_lore_entry_titles_bulk([]) == {}
+
+def test_create_lore_entries_bulk(lore_repo: LoreRepository):
+    """Tests inserting several lore entries in one transaction, and rolling back on failure."""
+    assert lore_repo.get_unique_categories() == []
+
+    success = lore_repo.create_lore_entries_bulk([
+        ("The Citadel", "<p>A fortress.</p>", "Location", None, 1),
+        ("The Shattering", "", "History", None, 2),
+    ])
+
+    assert success is True
+    assert [e['Title'] for e in lore_repo.get_all_lore_entries()] == ["The Citadel", "The Shattering"]
+    assert lore_repo.get_unique_categories() == ["History", "Location"]
+
+    # Titles are unique, so a duplicate rolls back the whole batch
+    with pytest.raises(DatabaseError):
+        lore_repo.create_lore_entries_bulk([("New Entry", "", "", None, 3), ("The Citadel", "", "", None, 4)])
+    assert lore_repo.get_number_of_lore_entries() == 2
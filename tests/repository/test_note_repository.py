@@ -0,0 +1,99 @@
+# tests/repository/test_note_repository.py
+
+import pytest
+from src.python.repository.note_repository import NoteRepository
+from src.python.db_connector import DBConnector 
+
+@pytest.fixture
+def note_repo(initialized_connector: DBConnector) -> NoteRepository:
+    """Provides a fresh NoteRepository instance for each test."""
+    return NoteRepository(initialized_connector)
+
+# --- Helper Function ---
+def create_test_note(repo: NoteRepository, title: str, sort_order: int = 0, content: str = "...") -> int:
+    """Helper to quickly create a note and return its ID."""
+    return repo.create_note(title, sort_order, content)
+
+# --- Tests ---
+
+def test_create_and_get_details(note_repo: NoteRepository):
+    """Tests creating a note and fetching its title and content."""
+    note_id = create_test_note(note_repo, "Plot Ideas", content="<p>A twist.</p>")
+
+    details = note_repo.get_note_details(note_id)
+
+    assert isinstance(note_id, int)
+    assert details['Title'] == "Plot Ideas"
+    assert details['Content'] == "<p>A twist.</p>"
+    assert note_repo.get_note_title(note_id) == "Plot Ideas"
+
+def test_get_all_notes_for_export_filtered(note_repo: NoteRepository):
+    """Tests exporting a subset of notes by ID, ordered by Sort_Order."""
+    last_id = create_test_note(note_repo, "Last", sort_order=3)
+    first_id = create_test_note(note_repo, "First", sort_order=1)
+    create_test_note(note_repo, "Middle", sort_order=2)
+
+    results = note_repo.get_all_notes_for_export([last_id, first_id, last_id] + list(range(1000, 2200)))
+
+    assert [n['ID'] for n in results] == [first_id, last_id]
+    assert [(n['Parent_Note_ID'], n['Sort_Order']) for n in results] == [(None, 1), (None, 3)]
+    assert len(note_repo.get_all_notes_for_export()) == 3
+
+def test_get_note_titles_bulk(note_repo: NoteRepository):
+    """Tests retrieving the titles of several notes in one call."""
+    first_id = create_test_note(note_repo, "First")
+    second_id = create_test_note(note_repo, "Second")
+    create_test_note(note_repo, "Third")
+
+    # Act: Include an ID that doesn't exist
+    titles = note_repo.get_note_titles_bulk([second_id, first_id, 9999])
+
+    # Assert
+    assert titles == {first_id: "First", second_id: "Second"}
+    assert note_repo.get_note_titles_bulk([]) == {}
+
+def test_get_note_title_missing(note_repo: NoteRepository):
+    """Tests that an unknown note ID has no title."""
+    assert note_repo.get_note_title(9999) is None
+
+def test_get_all_notes_ordering(note_repo: NoteRepository):
+    """Tests retrieval of all notes, ordered by Sort_Order ASC."""
+    last_id = create_test_note(note_repo, "Last", sort_order=3)
+    first_id = create_test_note(note_repo, "First", sort_order=1)
+    middle_id = create_test_note(note_repo, "Middle", sort_order=2)
+
+    notes = note_repo.get_all_notes()
+
+    assert [n['ID'] for n in notes] == [first_id, middle_id, last_id]
+
+def test_iter_notes_for_export_streams_rows(note_repo: NoteRepository):
+    """Tests that the export iterator yields the same rows lazily."""
+    create_test_note(note_repo, "Second", sort_order=2)
+    create_test_note(note_repo, "First", sort_order=1, content="<p>First</p>")
+
+    rows = note_repo.iter_notes_for_export()
+
+    assert next(rows)['Content'] == "<p>First</p>"
+    assert [n['Title'] for n in rows] == ["Second"]
+
+def test_create_notes_bulk(note_repo: NoteRepository):
+    """Tests inserting several notes in one transaction."""
+    success = note_repo.create_notes_bulk([
+        ("Second", "", None, 2),
+        ("First", "<p>First</p>", None, 1),
+    ])
+
+    assert success is True
+    assert [n['Title'] for n in note_repo.get_all_notes()] == ["First", "Second"]
+
+def test_search_notes_by_title_and_tag(note_repo: NoteRepository, initialized_connector: DBConnector):
+    """Tests that notes match on title or tags and are returned once each."""
+    from src.python.repository.tag_repository import TagRepository
+    tag_repo = TagRepository(initialized_connector)
+
+    plot_id = create_test_note(note_repo, "Plot Twists")
+    world_id = create_test_note(note_repo, "Worldbuilding")
+    tag_repo.set_tags_for_note(world_id, ['plot-hole', 'plotting'])
+
+    assert [n['ID'] for n in note_repo.search_notes("plot")] == [plot_id, world_id]
+    assert [n['ID'] for n in note_repo.search_notes("hole")] == [world_id]
@@ -59,6 +59,7 @@ def test_dbconnector_connect_and_close(clean_connector, db_path_temp):
     row = cursor.fetchone()
     # Check that row_factory=sqlite3.Row is working (allows access by name)
     assert row['value'] == 1 
+    assert clean_connector.conn.execute("PRAGMA cache_size;").fetchone()[0] == -20000
 
     # 3. Close
     clean_connector.close()
@@ -113,6 +114,18 @@ def test_execute_query_fetch_all_as_list(initialized_connector):
     assert results[0] == ('Chapter 1', 1)
     assert results[1] == ('Chapter 2', 2)
 
+def test_execute_query_iter_streams_rows(initialized_connector):
+    """Tests _execute_query_iter for lazily streaming rows as dicts."""
+    initialized_connector._execute_commit("INSERT INTO Chapters (Title, Sort_Order) VALUES (?, ?)", ('Chapter 1', 1))
+    initialized_connector._execute_commit("INSERT INTO Chapters (Title, Sort_Order) VALUES (?, ?)", ('Chapter 2', 2))
+
+    rows = initialized_connector._execute_query_iter("SELECT Title FROM Chapters ORDER BY Sort_Order")
+
+    # Nothing is materialized until the iterator is consumed
+    assert not isinstance(rows, list)
+    assert next(rows) == {'Title': 'Chapter 1'}
+    assert list(rows) == [{'Title': 'Chapter 2'}]
+
 def test_execute_transaction_success(initialized_connector):
     """Tests a sequence of operations that should commit successfully."""
     operations = [
@@ -162,6 +175,18 @@ def test_execute_transaction_rollback_on_error(initialized_connector):
     cursor = initialized_connector.conn.execute("SELECT Name FROM Tags WHERE Name=?", ('BadTag',))
     assert cursor.fetchone() is None
 
+def test_execute_many_rollback_on_error(initialized_connector):
+    """Tests that _execute_many applies every row, or none when one row fails."""
+    success = initialized_connector._execute_many("INSERT INTO Tags (Name) VALUES (?)", [('TagA',), ('TagB',)])
+    assert success is True
+
+    # The second row violates the UNIQUE constraint on Name
+    with pytest.raises(DatabaseError):
+        initialized_connector._execute_many("INSERT INTO Tags (Name) VALUES (?)", [('TagC',), ('TagA',)])
+
+    count = initialized_connector._execute_query("SELECT COUNT(*) FROM Tags", fetch_one=True)['COUNT(*)']
+    assert count == 2
+
 def test_db_connector_initialization(tmp_path):
     """Test that the connector initializes paths and connection is None."""
     db_path = str(tmp_path / 'test.db')